@@ -0,0 +1,118 @@
+"""Unit tests for CDPClient's pipelined ``cmd_many``.
+
+No browser required — the websocket is faked. These guard the reply
+bookkeeping: replies are matched by id whatever order Chrome sends them in,
+stray events and stale ids are skipped, and an error reply is raised only
+after every reply of the batch has been drained from the socket. Also covers
+``block_urls`` applying a blocklist once per connection.
+"""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from web_agent.errors import TransportError
+from web_agent.transport.cdp import CDPClient
+
+
+class _FakeWS:
+    """Records sent commands; ``replies`` maps the sent ids to what recv yields."""
+
+    def __init__(self, replies):
+        self.replies = replies
+        self.sent: list[dict] = []
+        self.inbox: list[dict] | None = None
+
+    def send(self, raw: str) -> None:
+        self.sent.append(json.loads(raw))
+
+    def recv(self) -> str:
+        if self.inbox is None:
+            self.inbox = self.replies([m["id"] for m in self.sent])
+        return json.dumps(self.inbox.pop(0))
+
+
+def _client(replies) -> CDPClient:
+    client = CDPClient()
+    client.ws = _FakeWS(replies)
+    return client
+
+
+# -- cmd_many: reply matching -----------------------------------------------
+
+
+def test_cmd_many_matches_out_of_order_replies():
+    client = _client(lambda ids: [
+        {"method": "Page.frameNavigated", "params": {}},  # event, no id
+        {"id": ids[2], "result": {"n": 3}},
+        {"id": ids[0] - 1, "result": {"stale": True}},  # reply to an older call
+        {"id": ids[0], "result": {"n": 1}},
+        {"id": ids[1], "result": {"n": 2}},
+    ])
+
+    out = client.cmd_many([("A.one", None), ("A.two", {"x": 1}), ("A.three", None)])
+
+    assert out == [{"n": 1}, {"n": 2}, {"n": 3}]
+    assert [m["method"] for m in client.ws.sent] == ["A.one", "A.two", "A.three"]
+    assert client.ws.sent[1]["params"] == {"x": 1}
+    assert client.ws.inbox == []
+
+
+def test_cmd_many_drains_every_reply_before_raising():
+    client = _client(lambda ids: [
+        {"id": ids[1], "error": {"message": "No node with given id"}},
+        {"id": ids[2], "result": {}},
+        {"id": ids[0], "result": {}},
+        {"method": "DOM.documentUpdated", "params": {}},  # arrives after the batch
+    ])
+
+    with pytest.raises(TransportError, match="DOM.two: No node with given id"):
+        client.cmd_many([("DOM.one", None), ("DOM.two", None), ("DOM.three", None)])
+
+    # All three replies were consumed; only the later event is left unread.
+    assert client.ws.inbox == [{"method": "DOM.documentUpdated", "params": {}}]
+
+
+def test_cmd_many_requires_connection():
+    with pytest.raises(TransportError):
+        CDPClient().cmd_many([("Page.enable", None)])
+
+
+# -- block_urls: once per connection ----------------------------------------
+
+
+def _connected_client() -> CDPClient:
+    client = CDPClient()
+    client.ws = MagicMock()
+    client._enabled = {"Page"}
+    client._blocked_urls = ()
+    client.cmd = MagicMock(return_value={})
+    client.cmd_many = MagicMock(return_value=[{}, {}])
+    return client
+
+
+def test_block_urls_is_sent_once_per_connection():
+    client = _connected_client()
+
+    client.block_urls(("*.png",))
+    client.block_urls(("*.png",))
+
+    client.cmd_many.assert_called_once_with([("Network.enable", None)])
+    client.cmd.assert_called_once_with("Network.setBlockedURLs", {"urls": ["*.png"]})
+
+
+def test_lifting_block_disables_network():
+    client = _connected_client()
+    client.block_urls(())
+    client.cmd.assert_not_called()  # nothing blocked yet, nothing to lift
+
+    client.block_urls(("*.png",))
+    client.cmd_many.reset_mock()
+    client.block_urls(())
+
+    client.cmd_many.assert_called_once_with(
+        [("Network.setBlockedURLs", {"urls": []}), ("Network.disable", None)])
+    assert "Network" not in client._enabled
@@ -0,0 +1,53 @@
+"""Unit tests for the crawler's robots.txt handling.
+
+No network — ``_robots_for`` is given built ``httpx.Response`` objects. These
+guard urllib's status rules: 401/403 and 5xx disallow everything (RFC 9309
+treats an unreachable robots.txt as a full disallow), other 4xx allow
+everything, 200 is parsed, and only a failed request means no rules.
+"""
+
+from __future__ import annotations
+
+import httpx
+
+from web_agent.scraper.crawl import _robots_for
+
+UA = "web-agent-test"
+
+
+def _resp(status: int, text: str = "") -> httpx.Response:
+    return httpx.Response(status, text=text)
+
+
+# -- _robots_for: status handling -------------------------------------------
+
+
+def test_robots_unauthorized_or_forbidden_disallows_all():
+    for status in (401, 403):
+        rp = _robots_for(_resp(status))
+        assert rp is not None
+        assert not rp.can_fetch(UA, "https://ex.com/")
+
+
+def test_robots_other_4xx_allows_all():
+    rp = _robots_for(_resp(404))
+    assert rp is not None
+    assert rp.can_fetch(UA, "https://ex.com/private/page")
+
+
+def test_robots_5xx_disallows_all():
+    for status in (500, 503):
+        rp = _robots_for(_resp(status))
+        assert rp is not None
+        assert rp.can_fetch(UA, "https://ex.com/") is False
+
+
+def test_robots_missing_response_returns_none():
+    assert _robots_for(None) is None
+
+
+def test_robots_200_is_parsed():
+    rp = _robots_for(_resp(200, "User-agent: *\nDisallow: /private/\n"))
+    assert rp is not None
+    assert rp.can_fetch(UA, "https://ex.com/public")
+    assert not rp.can_fetch(UA, "https://ex.com/private/page")
@@ -0,0 +1,87 @@
+"""Unit tests for the opt-in fetch cache.
+
+No network — FetchCache is exercised directly against a temp directory.
+Covers hit/miss, TTL expiry, that every key field splits entries, and that
+concurrent or failing writes never raise.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from web_agent.scraper.cache import FetchCache
+
+
+def _key(**overrides) -> str:
+    request = {"url": "https://example.com/", "engine": "auto",
+               "user_agent": "ua", "include_html": False, "include_links": True}
+    request.update(overrides)
+    return FetchCache.key(**request)
+
+
+def test_put_then_get_is_a_hit(tmp_path):
+    cache = FetchCache(tmp_path, ttl=60)
+    cache.put(_key(), {"markdown": "hello"})
+
+    assert cache.get(_key()) == {"markdown": "hello"}
+
+
+def test_unknown_key_is_a_miss(tmp_path):
+    cache = FetchCache(tmp_path, ttl=60)
+
+    assert cache.get(_key()) is None
+
+
+def test_entry_older_than_ttl_is_a_miss(tmp_path):
+    cache = FetchCache(tmp_path, ttl=60)
+    key = _key()
+    cache.put(key, {"markdown": "old"})
+    # Age the entry past the TTL.
+    path = tmp_path / f"{key}.json"
+    entry = json.loads(path.read_text())
+    entry["cached_at"] -= 61
+    path.write_text(json.dumps(entry))
+
+    assert cache.get(key) is None
+
+
+def test_every_key_field_splits_entries(tmp_path):
+    variants = [_key(), _key(url="https://example.com/other"), _key(engine="http"),
+                _key(user_agent="other"), _key(include_html=True), _key(include_links=False)]
+
+    assert len(set(variants)) == len(variants)
+    # Argument order doesn't matter — only the values do.
+    assert FetchCache.key(a=1, b=2) == FetchCache.key(b=2, a=1)
+
+
+def test_concurrent_puts_of_one_key_do_not_raise(tmp_path):
+    cache = FetchCache(tmp_path, ttl=60)
+    errors: list[BaseException] = []
+
+    def writer():
+        try:
+            for _ in range(50):
+                cache.put(_key(), {"markdown": "x"})
+        except BaseException as e:  # noqa: BLE001 — surfaced by the assert
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert cache.get(_key()) == {"markdown": "x"}
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_unwritable_cache_is_best_effort(tmp_path):
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+    cache = FetchCache(Path(blocker) / "cache", ttl=60)
+
+    cache.put(_key(), {"markdown": "x"})  # must not raise
+    assert cache.get(_key()) is None
@@ -0,0 +1,114 @@
+"""Unit tests for the crawl JobStore's page persistence.
+
+No network or worker process — pages are handed straight to ``save_page``.
+These guard content-hash dedupe: a repeated body is stored once, its manifest
+entry points at the original, and the index survives a fresh JobStore — and
+the pages.jsonl manifest that ``list_pages`` reads instead of every page body.
+"""
+
+from __future__ import annotations
+
+import json
+
+from web_agent.scraper.jobs import JobStore
+
+
+def _page(url: str, markdown: str) -> dict:
+    return {"url": url, "title": url.rsplit("/", 1)[-1], "markdown": markdown, "engine": "http"}
+
+
+def _manifest(store: JobStore, jid: str) -> list[dict]:
+    lines = (store.root / jid / "pages.jsonl").read_text().splitlines()
+    return [json.loads(line) for line in lines]
+
+
+# -- save_page: content-hash dedupe -----------------------------------------
+
+
+def test_duplicate_body_shares_json_path(tmp_path):
+    store = JobStore(tmp_path)
+    jid = store.create({"url": "https://ex.com/"})
+
+    first = store.save_page(jid, "https://ex.com/a", _page("https://ex.com/a", "# Same"))
+    again = store.save_page(jid, "https://ex.com/a?utm=x", _page("https://ex.com/a?utm=x", "# Same"))
+
+    assert again == first
+    assert len(list((tmp_path / jid / "pages").glob("*.json"))) == 1
+    original, dup = _manifest(store, jid)
+    assert "duplicate_of" not in original
+    assert dup["duplicate_of"] == "https://ex.com/a"
+    assert dup["url"] == "https://ex.com/a?utm=x"
+    assert dup["json_path"] == original["json_path"]
+    assert dup["content_hash"] == original["content_hash"]
+
+
+def test_distinct_bodies_get_their_own_files(tmp_path):
+    store = JobStore(tmp_path)
+    jid = store.create({"url": "https://ex.com/"})
+
+    a = store.save_page(jid, "https://ex.com/a", _page("https://ex.com/a", "# A"))
+    b = store.save_page(jid, "https://ex.com/b", _page("https://ex.com/b", "# B"))
+
+    assert a != b
+    assert all("duplicate_of" not in e for e in _manifest(store, jid))
+
+
+def test_empty_bodies_are_never_deduped(tmp_path):
+    store = JobStore(tmp_path)
+    jid = store.create({"url": "https://ex.com/"})
+
+    a = store.save_page(jid, "https://ex.com/a", _page("https://ex.com/a", ""))
+    b = store.save_page(jid, "https://ex.com/b", _page("https://ex.com/b", ""))
+
+    assert a != b
+    assert all("content_hash" not in e for e in _manifest(store, jid))
+
+
+def test_content_index_rebuilt_from_manifest_after_restart(tmp_path):
+    jid = JobStore(tmp_path).create({"url": "https://ex.com/"})
+    first = JobStore(tmp_path).save_page(jid, "https://ex.com/a", _page("https://ex.com/a", "# Same"))
+
+    # A fresh store (e.g. a resumed worker) has no in-memory index.
+    again = JobStore(tmp_path).save_page(jid, "https://ex.com/b", _page("https://ex.com/b", "# Same"))
+
+    assert again == first
+    assert _manifest(JobStore(tmp_path), jid)[-1]["duplicate_of"] == "https://ex.com/a"
+
+
+# -- list_pages: pages.jsonl manifest ---------------------------------------
+
+
+def test_list_pages_reads_manifest_sorted_by_path(tmp_path):
+    store = JobStore(tmp_path)
+    jid = store.create({"url": "https://ex.com/"})
+    store.save_page(jid, "https://ex.com/b", _page("https://ex.com/b", "# Bee"))
+    store.save_page(jid, "https://ex.com/a", _page("https://ex.com/a", "# A"))
+
+    pages = store.list_pages(jid)
+
+    assert [p["url"] for p in pages] == ["https://ex.com/a", "https://ex.com/b"]
+    assert pages[1]["char_count"] == len("# Bee")
+    assert pages[0]["engine"] == "http"
+
+
+def test_list_pages_tolerates_torn_last_line(tmp_path):
+    store = JobStore(tmp_path)
+    jid = store.create({"url": "https://ex.com/"})
+    store.save_page(jid, "https://ex.com/a", _page("https://ex.com/a", "# A"))
+    # A worker killed mid-append leaves half a JSON line behind.
+    with open(tmp_path / jid / "pages.jsonl", "a") as f:
+        f.write('{"url": "https://ex.com/b", "ti')
+
+    assert [p["url"] for p in store.list_pages(jid)] == ["https://ex.com/a"]
+
+
+def test_list_pages_falls_back_to_page_files_without_manifest(tmp_path):
+    store = JobStore(tmp_path)
+    jid = store.create({"url": "https://ex.com/"})
+    store.save_page(jid, "https://ex.com/a", _page("https://ex.com/a", "# A"))
+    (tmp_path / jid / "pages.jsonl").unlink()  # job from before the manifest
+
+    pages = store.list_pages(jid)
+
+    assert [p["url"] for p in pages] == ["https://ex.com/a"]
+    assert pages[0]["char_count"] == len("# A")
@@ -3,14 +3,20 @@
 Minimal Chrome CDP launcher with multi‑browser management and pretty logging.
 """
 
+import functools
+import glob
+import http.client
 import logging
 import os
+import re
+import shutil
 import subprocess
 import socket
+import sys
 import time
 import signal
-import atexit
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Collection, Dict, List, Optional, Tuple
 
 # ────────────────── configuration ──────────────────
 DEFAULT_PORT = 9222
@@ -23,7 +29,22 @@ CHROME_PATHS = [
     'google-chrome',
     'chromium'
 ]
-USER_DATA_DIR_TEMPLATE = '/tmp/chrome-cdp-session-{port}'
+# Throwaway profiles live on tmpfs where it has room, so Chrome's profile
+# writes never touch disk; they are deleted again when the browser is stopped.
+# A small /dev/shm (Docker defaults to 64 MB) is left to Chrome's own shared
+# memory — the profile's HTTP disk cache alone could fill it.
+SHM_MIN_FREE_BYTES = 1 << 30
+
+
+def _throwaway_profile_root() -> str:
+    try:
+        st = os.statvfs('/dev/shm')
+    except OSError:
+        return '/tmp'
+    return '/dev/shm' if st.f_bavail * st.f_frsize >= SHM_MIN_FREE_BYTES else '/tmp'
+
+
+USER_DATA_DIR_TEMPLATE = _throwaway_profile_root() + '/chrome-cdp-session-{port}'
 PERSISTENT_DATA_DIR = os.path.expanduser('~/.chrome-cdp-profile')
 STARTUP_TIMEOUT = 15  # seconds
 LOG_LEVEL = logging.INFO
@@ -33,6 +54,30 @@ PORT_RANGE_START = 9222
 PORT_RANGE_END   = 9400
 AUTO_REDIRECT_IF_BUSY = True  # if requested port is taken, pick the next slot
 
+# Flags every launch gets; only the port and profile dir vary per browser.
+BASE_ARGS = [
+    '--remote-allow-origins=*',
+    '--no-first-run',
+    '--no-default-browser-check',
+]
+# Extra flags for headless runs: skip subsystems an automation browser never
+# uses (extensions, sync, background fetches, media routing) so cold start is
+# faster and each instance is lighter under MultiBrowserManager. No
+# --disable-gpu: new headless already renders in software, so it does nothing.
+# Headed runs keep the user's normal browser behaviour.
+HEADLESS_EXTRA_ARGS = [
+    '--headless=new',
+    '--disable-extensions',
+    '--disable-component-extensions-with-background-pages',
+    '--disable-background-networking',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--metrics-recording-only',
+    '--mute-audio',
+    '--autoplay-policy=user-gesture-required',
+    '--disable-features=Translate,BackForwardCache,AcceptCHFrame,MediaRouter',
+]
+
 # PID files so this script can be used as a standalone tool across invocations
 PIDFILE_TEMPLATE = '/tmp/chrome-cdp-{port}.pid'
 # ───────────────────────────────────────────────────
@@ -66,54 +111,111 @@ log = _setup_logger()
 
 
 def _port_is_free(port: int) -> bool:
+    """True if we could bind the port right now and nobody is listening on it.
+
+    Two cheap local probes, no TCP handshake with a remote host:
+
+    - bind 127.0.0.1: SO_REUSEADDR keeps sockets lingering in TIME_WAIT from
+      marking a port as busy, but on macOS/BSD it also lets the bind succeed
+      next to a listener on 0.0.0.0;
+    - connect 127.0.0.1 and ::1: catches that listener, and one bound only
+      to IPv6 loopback. A closed port refuses at once.
+    """
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        return s.connect_ex(('localhost', port)) != 0
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        try:
+            s.bind(('127.0.0.1', port))
+        except OSError:
+            return False
+    return not any(_is_listening(family, host, port)
+                   for family, host in ((socket.AF_INET, '127.0.0.1'), (socket.AF_INET6, '::1')))
 
 
+def _is_listening(family: int, host: str, port: int) -> bool:
+    try:
+        with socket.socket(family, socket.SOCK_STREAM) as s:
+            s.settimeout(0.2)
+            return s.connect_ex((host, port)) == 0
+    except OSError:  # e.g. no IPv6 on this host
+        return False
+
+
+def _cdp_ready(port: int) -> bool:
+    """True once DevTools answers on the port.
+
+    An open port isn't enough: Chrome binds it before the DevTools HTTP
+    handler is serving, and early CDP clients then fail. /json/version
+    returning 200 means it's fully up.
+    """
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=0.5)
+    try:
+        conn.request('GET', '/json/version')
+        return conn.getresponse().status == 200
+    except (OSError, http.client.HTTPException):
+        return False
+    finally:
+        conn.close()
+
+
+@functools.lru_cache(maxsize=1)
 def _which_chrome() -> str:
+    # Existence + exec-bit check only: spawning `chrome --version` per
+    # candidate costs a full browser process start each.
     for path in CHROME_PATHS:
-        try:
-            subprocess.run([path, '--version'], capture_output=True, check=True)
-            return path
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            continue
+        resolved = path if os.path.isabs(path) else shutil.which(path)
+        if resolved and os.path.isfile(resolved) and os.access(resolved, os.X_OK):
+            return resolved
     raise FileNotFoundError(
         "Chrome/Chromium executable not found. Install Chrome or adjust CHROME_PATHS.")
 
 
 
-def find_free_port(preferred: Optional[int] = None, start: int = PORT_RANGE_START, end: int = PORT_RANGE_END) -> int:
-    """Return a free port. If preferred is busy, scan upward then wrap once."""
-    if preferred is not None and _port_is_free(preferred):
+def find_free_port(preferred: Optional[int] = None, start: int = PORT_RANGE_START, end: int = PORT_RANGE_END,
+                   exclude: Collection[int] = ()) -> int:
+    """Return a free port. If preferred is busy, scan upward then wrap once.
+
+    Ports in ``exclude`` are treated as taken (e.g. reserved for launches
+    that haven't bound yet).
+    """
+    if preferred is not None and preferred not in exclude and _port_is_free(preferred):
         return preferred
     if preferred is None:
         preferred = start
     for p in range(max(preferred, start), end + 1):
-        if _port_is_free(p):
+        if p not in exclude and _port_is_free(p):
             return p
     for p in range(start, min(preferred, end + 1)):
-        if _port_is_free(p):
+        if p not in exclude and _port_is_free(p):
             return p
     raise RuntimeError(f"No free port available in range {start}-{end}")
 
 # ───── pidfile helpers (tool-friendly) ─────
 
+_PIDFILE_RE = re.compile(re.escape(PIDFILE_TEMPLATE).replace(re.escape('{port}'), r'(\d+)'))
+
 def _pidfile_path(port: int) -> str:
     return PIDFILE_TEMPLATE.format(port=port)
 
-def _write_pidfile(port: int, pid: int) -> None:
+def _write_pidfile(port: int, pid: int, throwaway_dir: Optional[str] = None) -> None:
+    """Record the pid and, for throwaway sessions, the profile dir to delete on stop.
+
+    The dir is stored rather than recomputed because the /dev/shm-or-/tmp
+    choice depends on free space, which differs once Chrome is running.
+    """
     try:
         with open(_pidfile_path(port), 'w') as f:
-            f.write(str(pid))
+            f.write(str(pid) + ('\n' + throwaway_dir if throwaway_dir else ''))
     except Exception:
         pass
 
-def _read_pidfile(port: int) -> Optional[int]:
+def _read_pidfile(port: int) -> Tuple[Optional[int], Optional[str]]:
+    """Return (pid, throwaway profile dir or None)."""
     try:
         with open(_pidfile_path(port), 'r') as f:
-            return int(f.read().strip())
+            pid_line, _, dir_line = f.read().partition('\n')
+        return int(pid_line.strip()), dir_line.strip() or None
     except Exception:
-        return None
+        return None, None
 
 def _remove_pidfile(port: int) -> None:
     try:
@@ -121,43 +223,62 @@ def _remove_pidfile(port: int) -> None:
     except Exception:
         pass
 
+def _wait_group_exit(pgid: int, timeout: float) -> bool:
+    """Poll until every process in the group is gone. True if it exited in time."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            os.waitpid(pgid, os.WNOHANG)  # reap if it happens to be our child
+        except ChildProcessError:
+            pass
+        try:
+            os.killpg(pgid, 0)
+        except ProcessLookupError:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+
 def stop_port_external(port: int) -> bool:
     """Stop a browser started earlier (even by another process) using pidfile."""
-    pid = _read_pidfile(port)
+    pid, throwaway_dir = _read_pidfile(port)
     if not pid:
         return False
     try:
         os.killpg(pid, signal.SIGTERM)
-        time.sleep(0.2)
-        os.killpg(pid, signal.SIGKILL)
+        # Escalate only if Chrome is still around — no fixed sleep, and no
+        # SIGKILL aimed at a group that already exited.
+        if not _wait_group_exit(pid, 1.0):
+            os.killpg(pid, signal.SIGKILL)
     except ProcessLookupError:
         pass
     finally:
         _remove_pidfile(port)
+        # Only throwaway sessions record a dir; persistent profiles are kept.
+        if throwaway_dir:
+            shutil.rmtree(throwaway_dir, ignore_errors=True)
     return True
 
 def list_pidfile_ports() -> List[int]:
     """List ports that have pidfiles present (may include stale entries)."""
-    try:
-        import glob
-        ports = []
-        for path in glob.glob(PIDFILE_TEMPLATE.replace('{port}', '*')):
-            try:
-                ports.append(int(path.split('-')[-1].split('.pid')[0]))
-            except Exception:
-                continue
-        return sorted(ports)
-    except Exception:
-        return []
+    ports = []
+    for path in glob.glob(PIDFILE_TEMPLATE.replace('{port}', '*')):
+        m = _PIDFILE_RE.fullmatch(path)
+        if m:
+            ports.append(int(m.group(1)))
+    return sorted(ports)
 
 class BrowserCDP:
     """Single Chrome instance controlled via CDP."""
 
+    __slots__ = ("port", "headless", "profile", "process", "data_dir")
+
     def __init__(self, port: int = DEFAULT_PORT, headless: bool = DEFAULT_HEADLESS, profile: Optional[str] = DEFAULT_PROFILE):
         self.port = port
         self.headless = headless
-        self.profile = profile  # "persist" = ~/.chrome-cdp-profile, path = custom, None = /tmp throwaway
+        self.profile = profile  # "persist" = ~/.chrome-cdp-profile, path = custom, None = tmpfs throwaway
         self.process: Optional[subprocess.Popen] = None
+        self.data_dir: Optional[str] = None
 
     # ────────── public api ──────────
     def start(self) -> str:
@@ -173,17 +294,15 @@ class BrowserCDP:
             data_dir = os.path.expanduser(self.profile)
         else:
             data_dir = USER_DATA_DIR_TEMPLATE.format(port=self.port)
+        self.data_dir = data_dir
 
         args = [
             chrome,
             f'--remote-debugging-port={self.port}',
-            '--remote-allow-origins=*',
-            '--no-first-run',
-            '--no-default-browser-check',
             '--user-data-dir=' + data_dir,
+            *BASE_ARGS,
+            *(HEADLESS_EXTRA_ARGS if self.headless else ()),
         ]
-        if self.headless:
-            args.append('--headless=new')
 
         log.info(f"Launching Chrome on port {self.port} (headless={self.headless})")
         self.process = subprocess.Popen(
@@ -193,16 +312,17 @@ class BrowserCDP:
             preexec_fn=os.setsid  # so we can kill entire pg
         )
 
-        # wait for listening
-        deadline = time.time() + STARTUP_TIMEOUT
-        while time.time() < deadline:
-            if not _port_is_free(self.port):
-                _write_pidfile(self.port, self.process.pid)
+        # wait for DevTools
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if _cdp_ready(self.port):
+                _write_pidfile(self.port, self.process.pid,
+                               None if self.profile else self.data_dir)
                 log.info(f"Chrome ready at http://localhost:{self.port}")
                 return f"http://localhost:{self.port}"
             if self.process.poll() is not None:
                 raise RuntimeError("Chrome exited prematurely.")
-            time.sleep(0.2)
+            time.sleep(0.02)
 
         self.stop()
         raise TimeoutError(f"Chrome did not start within {STARTUP_TIMEOUT}s.")
@@ -214,6 +334,9 @@ class BrowserCDP:
         try:
             os.killpg(self.process.pid, signal.SIGTERM)
             self.process.wait(3)
+        except ProcessLookupError:
+            # Chrome already exited (e.g. a failed launch); just reap it.
+            self.process.wait()
         except subprocess.TimeoutExpired:
             log.warning("Graceful shutdown failed, killing…")
             try:
@@ -224,11 +347,15 @@ class BrowserCDP:
         finally:
             _remove_pidfile(self.port)
             self.process = None
+            if not self.profile and self.data_dir:
+                shutil.rmtree(self.data_dir, ignore_errors=True)
 
 
 class MultiBrowserManager:
     """Launch and track multiple BrowserCDP instances."""
 
+    __slots__ = ("_browsers",)
+
     def __init__(self):
         self._browsers: Dict[int, BrowserCDP] = {}
 
@@ -250,6 +377,32 @@ class MultiBrowserManager:
         self._browsers[port] = browser
         return url
 
+    def start_many(self, count: int, headless: bool = DEFAULT_HEADLESS, profile: Optional[str] = DEFAULT_PROFILE,
+                   preferred: Optional[int] = None) -> List[str]:
+        """Launch ``count`` browsers concurrently and return their URLs.
+
+        Chrome startup is mostly waiting, so N launches take about as long as
+        one. Ports are reserved up front so the parallel launches can't race
+        for the same slot. If any launch fails, the ones that came up are
+        stopped and the error is re-raised.
+        """
+        ports: List[int] = []
+        for i in range(count):
+            ports.append(find_free_port(preferred=preferred if i == 0 else None, exclude=ports))
+        browsers = [BrowserCDP(p, headless, profile=profile) for p in ports]
+
+        with ThreadPoolExecutor(max_workers=max(1, count)) as pool:
+            futures = [pool.submit(b.start) for b in browsers]
+        errors = [f.exception() for f in futures if f.exception() is not None]
+        if errors:
+            for b in browsers:
+                b.stop()
+            raise errors[0]
+
+        for b in browsers:
+            self._browsers[b.port] = b
+        return [f.result() for f in futures]
+
     def stop(self, port: int):
         browser = self._browsers.pop(port, None)
         if browser:
@@ -269,8 +422,6 @@ class MultiBrowserManager:
 
 # ─── quick demo & tool mode when executed as script ───
 if __name__ == "__main__":
-    import sys
-
     def _env(name: str, default: Optional[str] = None) -> Optional[str]:
         return os.getenv(name, default)
 
@@ -296,17 +447,10 @@ if __name__ == "__main__":
             except Exception:
                 pass
 
-        urls: List[str] = []
         desired = _env("CDP_PORT", "auto")
-        for i in range(count):
-            if desired != "auto" and i == 0:
-                try_port: Optional[int] = int(desired)
-            else:
-                try_port = None
-            port = find_free_port(preferred=try_port)
-            b = BrowserCDP(port=port, headless=headless, profile=profile)
-            url = b.start()
-            urls.append(url)
+        try_port: Optional[int] = int(desired) if desired != "auto" else None
+        urls = MultiBrowserManager().start_many(count, headless=headless, profile=profile, preferred=try_port)
+        for url in urls:
             log.info(f"STARTED {url}")
         # Print URLs and exit immediately; Chrome keeps running (no atexit)
         print("\n".join(urls))
@@ -3,6 +3,11 @@ import requests
 import websocket
 import time
 import base64
+from collections import deque
+
+# The only events anything waits on (see _wait_load). Buffering just these
+# keeps a busy page's other events from pushing them out of the deque.
+_WAITED_EVENTS = {"Page.frameNavigated", "Page.loadEventFired"}
 
 
 class WebTool:
@@ -10,46 +15,131 @@ class WebTool:
         self.port = port
         self.ws = None
         self.msg_id = 0
+        self._root_node_id = None  # DOM.getDocument root, reset when the document changes
+        self._responses = {}  # replies that arrived while waiting on another id
+        self._events = deque(maxlen=256)  # recent _WAITED_EVENTS, oldest dropped
+        self._http = requests.Session()  # keeps the DevTools HTTP connection alive across lookups
         
     def connect(self):
         """Connect to first tab"""
-        tabs = requests.get(f"http://localhost:{self.port}/json").json()
+        tabs = self._http.get(f"http://localhost:{self.port}/json").json()
         self.ws = websocket.create_connection(tabs[0]['webSocketDebuggerUrl'])
-        self.cmd("Page.enable")
-        self.cmd("DOM.enable")
-        self.cmd("Runtime.enable")
+        # Send all three enables at once; one round trip instead of three.
+        ids = [self._send(f"{domain}.enable") for domain in ("Page", "DOM", "Runtime")]
+        for msg_id in ids:
+            self._await(msg_id)
         
     def cmd(self, method, params=None):
         """Send command"""
+        return self._await(self._send(method, params))
+
+    def _send(self, method, params=None):
+        """Send a command without waiting; returns its id for _await()"""
         self.msg_id += 1
         msg = {"id": self.msg_id, "method": method, "params": params or {}}
         self.ws.send(json.dumps(msg))
-        
-        while True:
-            response = json.loads(self.ws.recv())
-            if response.get("id") == self.msg_id:
-                return response
+        return self.msg_id
+
+    def _await(self, msg_id):
+        """Read until the reply for msg_id arrives, filing everything else by id or as an event"""
+        while msg_id not in self._responses:
+            self._file(json.loads(self.ws.recv()))
+        return self._responses.pop(msg_id)
+
+    def _file(self, message):
+        if "id" in message:
+            self._responses[message["id"]] = message
+            return
+        if message.get("method") == "DOM.documentUpdated":
+            self._root_node_id = None  # every nodeId from the old document is dead
+        if message.get("method") in _WAITED_EVENTS:
+            self._events.append(message)
+
+    def _next_event(self, deadline):
+        """Pop the oldest event, reading from the socket until the monotonic deadline; None on timeout"""
+        prev_timeout = self.ws.gettimeout()
+        try:
+            while not self._events:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self.ws.settimeout(remaining)
+                try:
+                    self._file(json.loads(self.ws.recv()))
+                except websocket.WebSocketTimeoutException:
+                    return None
+        finally:
+            self.ws.settimeout(prev_timeout)
+        return self._events.popleft()
     
-    def go(self, url):
-        """Go to URL"""
-        self.cmd("Page.navigate", {"url": url})
-        time.sleep(2)  # Wait for page load
+    def go(self, url, timeout=10):
+        """Go to URL and wait until the new document is fully loaded"""
+        self._events.clear()  # only events caused by this navigation count
+        nav = self.cmd("Page.navigate", {"url": url})
+        self._root_node_id = None
+        if "error" in nav:
+            return False
+        loader_id = nav.get("result", {}).get("loaderId")
+        if not loader_id:
+            return True  # same-document navigation (e.g. #hash), nothing to load
+        return self._wait_load(timeout, loader_id)
+
+    def wait_for_load(self, timeout=10):
+        """Wait for a navigation the page started itself (link, form submit, Enter) to finish loading"""
+        return self._wait_load(timeout)
+
+    def _wait_load(self, timeout, loader_id=None):
+        # Block on Page.loadEventFired instead of polling: return as soon as
+        # the page loads, or give up after `timeout` seconds. The load event
+        # only counts once the main frame has committed a new document (this
+        # navigation's loader, when known), so a late load event from the old
+        # page can't satisfy it.
+        deadline = time.monotonic() + timeout
+        committed = False
+        while (event := self._next_event(deadline)) is not None:
+            method = event.get("method")
+            if method == "Page.frameNavigated":
+                frame = event.get("params", {}).get("frame", {})
+                if not frame.get("parentId") and loader_id in (None, frame.get("loaderId")):
+                    committed = True
+            elif method == "Page.loadEventFired" and committed:
+                return True
+        return False
+
+    def _eval_value(self, expression):
+        """Evaluate an expression by value, without js()'s error printing"""
+        result = self.cmd("Runtime.evaluate", {"expression": expression, "returnByValue": True})
+        return result.get("result", {}).get("result", {}).get("value")
+
+    def _get_root(self):
+        """Root nodeId of the current document, fetched once per page"""
+        if self._root_node_id is None:
+            doc = self.cmd("DOM.getDocument")
+            self._root_node_id = doc["result"]["root"]["nodeId"]
+        return self._root_node_id
+
+    def _query(self, selector):
+        """nodeId of the first match for selector (0 if none)"""
+        # Always re-run the selector: a remembered nodeId can stay attached
+        # while no longer being the first match, and confirming that it
+        # still matches costs the same round trip as querying again.
+        element = self.cmd("DOM.querySelector", {"nodeId": self._get_root(), "selector": selector})
+        if "error" in element:
+            # Cached root went stale (e.g. a navigation we didn't drive); refetch once.
+            self._root_node_id = None
+            element = self.cmd("DOM.querySelector", {"nodeId": self._get_root(), "selector": selector})
+        return element.get("result", {}).get("nodeId") or 0
         
     def click(self, selector):
         """Click element
         
         For debugging element selection issues, see: docs/element_debugging.md
         """
-        doc = self.cmd("DOM.getDocument")
-        root = doc["result"]["root"]["nodeId"]
-        element = self.cmd("DOM.querySelector", {"nodeId": root, "selector": selector})
-        
-        if not element["result"]["nodeId"]:
+        node_id = self._query(selector)
+        if not node_id:
             return False
             
-        node_id = element["result"]["nodeId"]
         box = self.cmd("DOM.getBoxModel", {"nodeId": node_id})
-        
         if "error" in box:
             return False
             
@@ -63,8 +153,17 @@ class WebTool:
         
     def type(self, text):
         """Type text"""
-        for char in text:
-            self.cmd("Input.dispatchKeyEvent", {"type": "char", "text": char})
+        # Input.insertText commits the whole string as one command.
+        if text:
+            self.cmd("Input.insertText", {"text": text})
+
+    def type_chars(self, text):
+        """Type text as per-character key events (for widgets that listen for keys)"""
+        # Send every key event first, then collect the replies: one round
+        # trip for the whole string instead of one per character.
+        ids = [self._send("Input.dispatchKeyEvent", {"type": "char", "text": char}) for char in text]
+        for msg_id in ids:
+            self._await(msg_id)
             
     def fill(self, selector, text):
         """Fill input"""
@@ -125,24 +224,23 @@ class WebTool:
         
     def wait(self, selector, timeout=10):
         """Wait for element"""
-        start = time.time()
-        while time.time() - start < timeout:
-            doc = self.cmd("DOM.getDocument")
-            root = doc["result"]["root"]["nodeId"]
-            element = self.cmd("DOM.querySelector", {"nodeId": root, "selector": selector})
-            if element["result"]["nodeId"]:
+        # One evaluate per probe (not getDocument + querySelector), polled
+        # every 50ms so a wait ends soon after the element appears.
+        probe = f"document.querySelector({json.dumps(selector)}) !== null"
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._eval_value(probe):
                 return True
-            time.sleep(0.5)
+            time.sleep(0.05)
         return False
         
     def screenshot(self, filename=None, quality=80, format="jpeg"):
         """Take screenshot with optimized size for AI context"""
-        params = {
-            "format": format,
-            "quality": quality if format == "jpeg" else None
-        }
-        # Remove None values
-        params = {k: v for k, v in params.items() if v is not None}
+        # optimizeForSpeed trades a little compression for a much faster
+        # encode inside Chrome; older builds ignore it.
+        params = {"format": format, "optimizeForSpeed": True}
+        if format == "jpeg":
+            params["quality"] = quality
         
         result = self.cmd("Page.captureScreenshot", params)
         data = result["result"]["data"]
@@ -155,18 +253,19 @@ class WebTool:
         
     def text(self, selector):
         """Get element text"""
-        code = f"document.querySelector('{selector}').textContent"
+        code = f"document.querySelector({json.dumps(selector)}).textContent"
         return self.js(code)
         
     def attr(self, selector, attribute):
         """Get element attribute"""
-        code = f"document.querySelector('{selector}').getAttribute('{attribute}')"
+        code = f"document.querySelector({json.dumps(selector)}).getAttribute({json.dumps(attribute)})"
         return self.js(code)
         
     def close(self):
         """Close connection"""
         if self.ws:
             self.ws.close()
+        self._http.close()
 
 
 # Simple usage
@@ -177,8 +276,7 @@ if __name__ == "__main__":
     web.go("https://google.com")
     web.fill("input[name='q']", "hello world")
     web.key("Enter")
-    
-    time.sleep(3)
+    web.wait_for_load()
     web.screenshot("result.png")
     
     web.close()
\ No newline at end of file
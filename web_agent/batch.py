@@ -7,7 +7,7 @@ JSON payload describing every step.
 
 Supported ops::
 
-    {"op": "navigate", "url": "...", "wait": 2.0}
+    {"op": "navigate", "url": "...", "wait": 2.0}   # optional "wait_until": "domcontentloaded"
     {"op": "snapshot"}                              # capture/refresh
     {"op": "find", "role": "button", "name": "Submit"}   # returns handle
     {"op": "click", "handle": "button:submit"}
@@ -31,11 +31,12 @@ plus `kind`/`error`/`hint`. The caller sees exactly which step broke.
 from __future__ import annotations
 
 import time
+from typing import Callable
 
-from .errors import StaleHandle, WebAgentError
+from .errors import InvalidArguments, StaleHandle, WebAgentError
 from .inspector import capture_snapshot, query_snapshot
 from .inspector.act import act_on_handle
-from .inspector.query import find_by_handle, read_handle
+from .inspector.query import read_handle
 from .inspector.store import SnapshotStore
 from .primitives import dom
 from .transport import CDPClient
@@ -71,112 +72,148 @@ def _resolve_handle(snap: dict, find_spec: dict, client: CDPClient) -> tuple[str
             f"No element matches {find_spec!r}.",
             hint="Loosen the filters (drop --name, try --text), or pass --all-visibility.",
         )
-    handle = out["matches"][0]["handle"]
-    el = find_by_handle(snap, handle)
-    assert el is not None  # query just returned it
-    return handle, out
+    return out["matches"][0]["handle"], out
+
+
+class _Session:
+    """Snapshot state threaded through the ops of one batch."""
+
+    def __init__(self, client: CDPClient, store: SnapshotStore):
+        self.client = client
+        self.store = store
+        self.snap: dict | None = None
+        self.sid: str | None = None
+
+    def capture(self) -> dict:
+        self.snap = capture_snapshot(self.client)
+        self.sid = self.store.save(self.snap)
+        self.snap["id"] = self.sid
+        return self.snap
+
+    def ensure_snap(self) -> dict:
+        return self.snap if self.snap is not None else self.capture()
+
+
+# Each op handler returns the step's payload; run_batch adds ok/op/step.
+
+def _op_navigate(sess: _Session, op: dict, i: int) -> dict:
+    wait_until = op.get("wait_until", "load")
+    if wait_until not in ("load", "domcontentloaded"):
+        raise InvalidArguments(
+            f"Step {i} 'navigate': unknown wait_until {wait_until!r}.",
+            hint="Use 'load' (default) or 'domcontentloaded'.",
+        )
+    info = dom.navigate(sess.client, op["url"], wait_seconds=op.get("wait", 2.0),
+                        wait_until=wait_until)
+    # Navigation invalidates any held snapshot.
+    sess.snap = None
+    sess.sid = None
+    if not op.get("snap", True):
+        return info
+    s = sess.ensure_snap()
+    return {"url": info.get("url"), "title": info.get("title"),
+            "snapshot_id": s["id"], "total_elements": s["summary"]["total"]}
+
+
+def _op_snapshot(sess: _Session, op: dict, i: int) -> dict:
+    s = sess.capture()
+    return {"snapshot_id": s["id"], "total_elements": s["summary"]["total"]}
+
+
+def _op_find(sess: _Session, op: dict, i: int) -> dict:
+    s = sess.ensure_snap()
+    _, out = _resolve_handle(s, op, sess.client)
+    return {"snapshot_id": s["id"], **{k: out[k] for k in ("shown", "total", "matches")}}
+
+
+def _op_act(sess: _Session, op: dict, i: int) -> dict:
+    name = op["op"]
+    s = sess.ensure_snap()
+    handle = op.get("handle")
+    if handle is None and "find" in op:
+        handle, _ = _resolve_handle(s, op["find"], sess.client)
+    if not handle:
+        raise WebAgentError(
+            f"Step {i} '{name}' needs either 'handle' or 'find'.",
+            hint="Pass {'handle': '...'} or {'find': {'role': '...', 'name': '...'}}.",
+        )
+    extra = {}
+    if name == "fill":
+        extra["text"] = op.get("text", "")
+    result = act_on_handle(sess.client, s, handle, name, **extra)
+    return {"handle": handle, **result}
+
+
+def _op_read(sess: _Session, op: dict, i: int) -> dict:
+    return read_handle(sess.ensure_snap(), op["handle"])
+
+
+def _op_js(sess: _Session, op: dict, i: int) -> dict:
+    return {"value": sess.client.evaluate(op["code"])}
+
+
+def _op_key(sess: _Session, op: dict, i: int) -> dict:
+    sess.client.dispatch_key(op["key"])
+    return {"key": op["key"]}
+
+
+def _op_page_info(sess: _Session, op: dict, i: int) -> dict:
+    return sess.client.page_info()
+
+
+def _op_sleep(sess: _Session, op: dict, i: int) -> dict:
+    time.sleep(float(op.get("seconds", 0)))
+    return {"slept": op.get("seconds", 0)}
+
+
+# Op name → handler. One dict lookup per step instead of an if/elif chain,
+# and the "Supported:" hint below is derived from it.
+_OPS: dict[str, Callable[[_Session, dict, int], dict]] = {
+    "navigate": _op_navigate,
+    "snapshot": _op_snapshot,
+    "find": _op_find,
+    "click": _op_act,
+    "fill": _op_act,
+    "focus": _op_act,
+    "scroll_into_view": _op_act,
+    "read": _op_read,
+    "js": _op_js,
+    "key": _op_key,
+    "page_info": _op_page_info,
+    "sleep": _op_sleep,
+}
 
 
 def run_batch(client: CDPClient, store: SnapshotStore, ops: list[dict]) -> dict:
-    snap: dict | None = None
-    sid: str | None = None
+    sess = _Session(client, store)
     steps: list[dict] = []
 
-    def _ensure_snap() -> dict:
-        nonlocal snap, sid
-        if snap is None:
-            snap = capture_snapshot(client)
-            sid = store.save(snap)
-            snap["id"] = sid
-        return snap
-
     for i, op in enumerate(ops):
         if not isinstance(op, dict) or "op" not in op:
             steps.append({"ok": False, "kind": "invalid_arguments",
                           "error": f"Step {i}: each op must be a dict with an 'op' field.",
                           "step": i})
-            return {"ok": False, "steps": steps, "snapshot_id": sid}
+            return {"ok": False, "steps": steps, "snapshot_id": sess.sid}
 
         name = op["op"]
-        try:
-            if name == "navigate":
-                info = dom.navigate(client, op["url"], wait_seconds=op.get("wait", 2.0))
-                # Navigation invalidates any held snapshot.
-                snap = None
-                sid = None
-                if op.get("snap", True):
-                    s = _ensure_snap()
-                    steps.append({"ok": True, "op": name, "step": i,
-                                  "url": info.get("url"), "title": info.get("title"),
-                                  "snapshot_id": s["id"], "total_elements": s["summary"]["total"]})
-                else:
-                    steps.append({"ok": True, "op": name, "step": i, **info})
-
-            elif name == "snapshot":
-                snap = capture_snapshot(client)
-                sid = store.save(snap)
-                snap["id"] = sid
-                steps.append({"ok": True, "op": name, "step": i,
-                              "snapshot_id": sid, "total_elements": snap["summary"]["total"]})
-
-            elif name == "find":
-                s = _ensure_snap()
-                _, out = _resolve_handle(s, op, client)
-                steps.append({"ok": True, "op": name, "step": i,
-                              "snapshot_id": s["id"], **{k: out[k] for k in ("shown", "total", "matches")}})
-
-            elif name in ("click", "fill", "focus", "scroll_into_view"):
-                s = _ensure_snap()
-                handle = op.get("handle")
-                if handle is None and "find" in op:
-                    handle, _ = _resolve_handle(s, op["find"], client)
-                if not handle:
-                    raise WebAgentError(
-                        f"Step {i} '{name}' needs either 'handle' or 'find'.",
-                        hint="Pass {'handle': '...'} or {'find': {'role': '...', 'name': '...'}}.",
-                    )
-                extra = {}
-                if name == "fill":
-                    extra["text"] = op.get("text", "")
-                result = act_on_handle(client, s, handle, name, **extra)
-                steps.append({"ok": True, "op": name, "step": i, "handle": handle, **result})
-
-            elif name == "read":
-                s = _ensure_snap()
-                handle = op["handle"]
-                steps.append({"ok": True, "op": name, "step": i, **read_handle(s, handle)})
-
-            elif name == "js":
-                value = client.evaluate(op["code"])
-                steps.append({"ok": True, "op": name, "step": i, "value": value})
-
-            elif name == "key":
-                client.dispatch_key(op["key"])
-                steps.append({"ok": True, "op": name, "step": i, "key": op["key"]})
-
-            elif name == "page_info":
-                steps.append({"ok": True, "op": name, "step": i, **client.page_info()})
-
-            elif name == "sleep":
-                time.sleep(float(op.get("seconds", 0)))
-                steps.append({"ok": True, "op": name, "step": i, "slept": op.get("seconds", 0)})
-
-            else:
-                steps.append({"ok": False, "kind": "invalid_arguments",
-                              "error": f"Unknown op {name!r}.", "step": i,
-                              "hint": "Supported: navigate, snapshot, find, click, fill, focus, "
-                                      "scroll_into_view, read, js, key, page_info, sleep."})
-                return {"ok": False, "steps": steps, "snapshot_id": sid}
+        handler = _OPS.get(name)
+        if handler is None:
+            steps.append({"ok": False, "kind": "invalid_arguments",
+                          "error": f"Unknown op {name!r}.", "step": i,
+                          "hint": f"Supported: {', '.join(_OPS)}."})
+            return {"ok": False, "steps": steps, "snapshot_id": sess.sid}
 
+        try:
+            steps.append({"ok": True, "op": name, "step": i, **handler(sess, op, i)})
         except StaleHandle as e:
             # act_on_handle already retried once; if we get here the element
             # is really gone.
             steps.append({"ok": False, "kind": "stale_handle", "error": str(e),
                           "step": i, "op": name, "hint": e.hint})
-            return {"ok": False, "steps": steps, "snapshot_id": sid}
+            return {"ok": False, "steps": steps, "snapshot_id": sess.sid}
         except WebAgentError as e:
             steps.append({"ok": False, "kind": e.kind, "error": str(e),
                           "step": i, "op": name, "hint": e.hint})
-            return {"ok": False, "steps": steps, "snapshot_id": sid}
+            return {"ok": False, "steps": steps, "snapshot_id": sess.sid}
 
-    return {"ok": True, "steps": steps, "snapshot_id": sid, "step_count": len(steps)}
+    return {"ok": True, "steps": steps, "snapshot_id": sess.sid, "step_count": len(steps)}
@@ -22,9 +22,12 @@ from __future__ import annotations
 
 import argparse
 import json
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from .batch import run_batch
 from .errors import InvalidArguments, WebAgentError
 from .inspector import (
     SnapshotStore,
@@ -43,8 +46,8 @@ from .transport import CDPClient
 
 
 def _emit(payload: dict, status: int = 0) -> None:
-    json.dump(payload, sys.stdout, indent=2, default=str)
-    sys.stdout.write("\n")
+    # json.dump streams one write() per encoder chunk; encode once instead.
+    sys.stdout.write(json.dumps(payload, indent=2, default=str) + "\n")
     sys.exit(status)
 
 
@@ -99,21 +102,23 @@ def cmd_act(args) -> None:
 
 def cmd_navigate(args) -> None:
     with _client(args) as client:
-        info = dom.navigate(client, args.url, wait_seconds=args.wait)
+        info = dom.navigate(client, args.url, wait_seconds=args.wait, wait_until=args.wait_until)
         payload = dict(info)
         if args.snap:
             # Verify the page actually loaded the URL we asked for. Concurrent
-            # navigations on the same tab can race the snapshot capture.
-            live = client.page_info()
-            payload["url"] = live.get("url")
-            payload["title"] = live.get("title")
+            # navigations on the same tab can race the snapshot capture. The
+            # snapshot reads url/title itself, so reuse those rather than
+            # spending another round-trip on page_info.
             snap = capture_snapshot(client)
+            live_url = snap.get("url")
+            payload["url"] = live_url
+            payload["title"] = snap.get("title")
             sid = _store(args).save(snap)
             snap["id"] = sid
             payload["snapshot"] = receipt(snap)
-            if args.url and live.get("url") and not live["url"].startswith(args.url.split("#")[0]):
+            if args.url and live_url and not live_url.startswith(args.url.split("#")[0]):
                 payload["warning"] = (
-                    f"Loaded URL {live.get('url')!r} differs from requested {args.url!r} — "
+                    f"Loaded URL {live_url!r} differs from requested {args.url!r} — "
                     "another navigation may have raced on this tab."
                 )
     _emit(payload)
@@ -125,7 +130,6 @@ def cmd_batch(args) -> None:
     Accepts ops either inline (``web-agent batch '<json>'``) or via stdin
     (``... | web-agent batch -``). One CDP connection serves all ops.
     """
-    from .batch import run_batch
     if args.ops_json == "-":
         payload = sys.stdin.read()
     else:
@@ -234,26 +238,76 @@ def _require_scraper():
 def cmd_fetch(args) -> None:
     scraper_fetch, DEFAULT_USER_AGENT, _ = _require_scraper()
     ua = args.user_agent if args.user_agent is not None else DEFAULT_USER_AGENT
-    result = scraper_fetch(
-        args.url,
-        engine=args.engine,
-        port=args.port,
-        timeout=args.timeout,
-        user_agent=ua,
-        include_html=args.include_html,
-        screenshot_path=args.screenshot,
-    )
+    if args.cache_ttl < 0:
+        raise InvalidArguments(
+            f"--cache-ttl must be non-negative (got {args.cache_ttl}).",
+            hint="Use 0 to disable the cache, or a positive number of seconds.",
+        )
+    if len(args.url) == 1:
+        _emit(_fetch_one(args, args.url[0], scraper_fetch, ua))
+
+    if args.screenshot:
+        raise InvalidArguments(
+            "--screenshot takes a single URL.",
+            hint="Fetch the page to screenshot on its own.",
+        )
+    if args.concurrency < 1:
+        raise InvalidArguments(
+            f"--concurrency must be at least 1 (got {args.concurrency}).",
+            hint="Use 1 to fetch the URLs one at a time.",
+        )
+
+    def _one(url: str) -> dict:
+        try:
+            return _fetch_one(args, url, scraper_fetch, ua)
+        except WebAgentError as e:
+            return {**e.to_dict(), "url": url}
+
+    # Fetches are network-bound, so threads overlap them; results keep the
+    # order the URLs were given in.
+    with ThreadPoolExecutor(max_workers=min(args.concurrency, len(args.url))) as pool:
+        results = list(pool.map(_one, args.url))
+    ok = all(r["ok"] for r in results)
+    _emit({"ok": ok, "results": results}, status=0 if ok else 2)
+
+
+def _fetch_one(args, url: str, scraper_fetch, ua: str) -> dict:
+    # Neither output mode reports links, so don't extract them at all.
+    include_links = not (args.no_links or args.markdown_only)
+    # A screenshot needs the live page, so it always bypasses the cache.
+    cache = None
+    if args.cache_ttl > 0 and not args.screenshot:
+        from .scraper.cache import FetchCache  # noqa: PLC0415 — already inside scraper guard
+        cache = FetchCache(args.cache_dir, ttl=args.cache_ttl)
+    result = None
+    if cache:
+        key = cache.key(url=url, engine=args.engine, user_agent=ua,
+                        include_html=args.include_html, include_links=include_links)
+        result = cache.get(key)
+        if result is not None:
+            result["cache"] = "hit"
+    if result is None:
+        result = scraper_fetch(
+            url,
+            engine=args.engine,
+            port=args.port,
+            timeout=args.timeout,
+            user_agent=ua,
+            include_html=args.include_html,
+            include_links=include_links,
+            screenshot_path=args.screenshot,
+        )
+        if cache:
+            cache.put(key, result)
     if args.output_dir:
         out = Path(args.output_dir)
         out.mkdir(parents=True, exist_ok=True)
         from .scraper.jobs import _slugify  # noqa: PLC0415 — already inside scraper guard
-        path = out / f"{_slugify(result.get('url') or args.url)}.md"
+        path = out / f"{_slugify(result.get('url') or url)}.md"
         path.write_text(result.get("markdown") or "")
         result["markdown_path"] = str(path)
-    if args.no_links:
-        result["links"] = []
     if args.markdown_only:
-        _emit({
+        return {
             "ok": True,
             "url": result.get("url"),
             "engine": result.get("engine"),
@@ -261,9 +315,8 @@ def cmd_fetch(args) -> None:
             "attempts": result.get("attempts", []),
             "markdown": result.get("markdown", ""),
             "warning": result.get("warning"),
-        })
-    else:
-        _emit({"ok": True, **result})
+        }
+    return {"ok": True, **result}
 
 
 def _job_store(args):
@@ -272,9 +325,6 @@ def _job_store(args):
 
 
 def cmd_crawl(args) -> None:
-    import subprocess
-    import sys as _sys
-
     if args.delay < 0:
         raise InvalidArguments(
             f"--delay must be non-negative (got {args.delay}).",
@@ -285,6 +335,11 @@ def cmd_crawl(args) -> None:
             f"--timeout must be positive (got {args.timeout}).",
             hint="Pass a positive number of seconds.",
         )
+    if args.concurrency < 1:
+        raise InvalidArguments(
+            f"--concurrency must be at least 1 (got {args.concurrency}).",
+            hint="Use 1 to fetch pages one at a time.",
+        )
     spec = {
         "url": args.url,
         "limit": args.limit,
@@ -297,6 +352,7 @@ def cmd_crawl(args) -> None:
         "timeout": args.timeout,
         "user_agent": args.user_agent,
         "use_sitemap": not args.no_sitemap,
+        "concurrency": args.concurrency,
     }
     store = _job_store(args)
     jid = store.create(spec)
@@ -305,7 +361,7 @@ def cmd_crawl(args) -> None:
     # so they don't pollute the parent's JSON output.
     log = open(store.job_dir(jid) / "worker.log", "wb")
     proc = subprocess.Popen(
-        [_sys.executable, "-m", "web_agent.scraper.worker", jid,
+        [sys.executable, "-m", "web_agent.scraper.worker", jid,
          "--crawls-dir", str(args.crawls_dir)],
         stdout=log, stderr=subprocess.STDOUT,
         start_new_session=True,
@@ -425,6 +481,9 @@ def build_parser() -> argparse.ArgumentParser:
     sp = sub.add_parser("navigate", help="Load a URL")
     sp.add_argument("url")
     sp.add_argument("--wait", type=float, default=2.0)
+    sp.add_argument("--wait-until", choices=["load", "domcontentloaded"], default="load",
+                    help="Page event that ends the wait (default load; domcontentloaded "
+                         "skips waiting on images/ads)")
     sp.add_argument("--snap", action="store_true",
                     help="Capture a snapshot after load and include it in the response (saves an LLM turn)")
     sp.set_defaults(fn=cmd_navigate)
@@ -475,7 +534,15 @@ def build_parser() -> argparse.ArgumentParser:
 
     # ---- scraper subcommands ----
     sp = sub.add_parser("fetch", help="URL → clean markdown (Jina/HTTP/CDP ladder)")
-    sp.add_argument("url")
+    sp.add_argument("url", nargs="+",
+                    help="One or more URLs; several are fetched concurrently and "
+                         "returned as {ok, results: [...]}")
+    sp.add_argument("--concurrency", type=int, default=4,
+                    help="Parallel fetches when several URLs are given (default 4)")
+    sp.add_argument("--cache-ttl", type=float, default=0.0, metavar="SECONDS",
+                    help="Reuse a cached result younger than SECONDS (default 0 = no cache)")
+    sp.add_argument("--cache-dir", default=".fetch-cache",
+                    help="Directory for the fetch cache (default .fetch-cache)")
     sp.add_argument("--engine", choices=["auto", "jina", "http", "cdp"], default="auto")
     sp.add_argument("--markdown-only", action="store_true",
                     help="Return only {url, engine, title, markdown, attempts}")
@@ -505,6 +572,8 @@ def build_parser() -> argparse.ArgumentParser:
                     help="Seconds between page fetches (default 0.5; 0 to disable)")
     sp.add_argument("--timeout", type=float, default=20.0,
                     help="Per-page fetch timeout in seconds (default 20)")
+    sp.add_argument("--concurrency", type=int, default=1,
+                    help="Pages fetched ahead in parallel (default 1; --delay still paces them)")
     sp.add_argument("--user-agent", default=None,
                     help="Override the User-Agent (used by both fetch and robots check)")
     sp.set_defaults(fn=cmd_crawl)
@@ -103,11 +103,14 @@ def act_on_handle(client: CDPClient, snapshot: dict, handle: str, action: str, *
             model = _resolve_box(client, el, snapshot)
             x, y = _bbox_center(model)
             client.dispatch_click(x, y)
-        # Select-all then replace — Input.insertText sends the whole string
-        # in a single CDP round-trip.
-        client.cmd("Input.dispatchKeyEvent", {"type": "keyDown", "key": "a", "modifiers": 4})  # cmd-a on mac
-        client.cmd("Input.dispatchKeyEvent", {"type": "keyUp", "key": "a", "modifiers": 4})
-        client.dispatch_key("Delete")
+        # Select-all then replace — the four key events go out pipelined and
+        # Input.insertText sends the whole string in a single CDP round-trip.
+        client.cmd_many([
+            ("Input.dispatchKeyEvent", {"type": "keyDown", "key": "a", "modifiers": 4}),  # cmd-a on mac
+            ("Input.dispatchKeyEvent", {"type": "keyUp", "key": "a", "modifiers": 4}),
+            ("Input.dispatchKeyEvent", {"type": "keyDown", "key": "Delete"}),
+            ("Input.dispatchKeyEvent", {"type": "keyUp", "key": "Delete"}),
+        ])
         client.type_text(text)
         return {"ok": True, "action": "fill", "handle": handle, "text": text,
                 "snapshot_id": sid,
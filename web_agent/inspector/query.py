@@ -4,8 +4,11 @@ from __future__ import annotations
 
 from typing import Iterable
 
+from ..errors import StaleHandle
+
 
 def _match(el: dict, *, role, name_contains, tag, text_contains, visible_only, scope_selector) -> bool:
+    # ``name_contains`` / ``text_contains`` arrive already lowercased.
     if visible_only and not el.get("visible"):
         return False
     if role and el.get("role") != role:
@@ -14,13 +17,13 @@ def _match(el: dict, *, role, name_contains, tag, text_contains, visible_only, s
         return False
     if name_contains:
         n = (el.get("name") or "").lower()
-        if name_contains.lower() not in n:
+        if name_contains not in n:
             return False
     if text_contains:
         haystack = " ".join(
             str(x or "") for x in (el.get("name"), el.get("value"), el.get("description"))
         ).lower()
-        if text_contains.lower() not in haystack:
+        if text_contains not in haystack:
             return False
     if scope_selector:
         sel = el.get("selector") or ""
@@ -48,6 +51,8 @@ def query_snapshot(
     limit: int = 20,
 ) -> dict:
     elements: Iterable[dict] = snapshot["elements"]
+    name_contains = name_contains.lower() if name_contains else name_contains
+    text_contains = text_contains.lower() if text_contains else text_contains
     matched = [
         el for el in elements
         if _match(
@@ -84,17 +89,25 @@ def query_snapshot(
     return out
 
 
+# Last (elements list, handle -> element) pair. Keyed on the list object
+# itself, so a refresh that swaps in a new ``elements`` list rebuilds it.
+_handle_index: tuple[list, dict[str, dict]] | None = None
+
+
 def find_by_handle(snapshot: dict, handle: str) -> dict | None:
-    for el in snapshot["elements"]:
-        if el.get("handle") == handle:
-            return el
-    return None
+    global _handle_index
+    elements = snapshot["elements"]
+    if _handle_index is None or _handle_index[0] is not elements:
+        index: dict[str, dict] = {}
+        for el in elements:
+            index.setdefault(el.get("handle"), el)  # first match wins, as before
+        _handle_index = (elements, index)
+    return _handle_index[1].get(handle)
 
 
 def read_handle(snapshot: dict, handle: str) -> dict:
     el = find_by_handle(snapshot, handle)
     if not el:
-        from ..errors import StaleHandle
         raise StaleHandle(
             f"Handle {handle!r} not in snapshot {snapshot['id']}.",
             hint="Run `inspect` to refresh, then re-query.",
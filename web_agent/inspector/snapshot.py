@@ -30,6 +30,9 @@ _INTERACTIVE_ROLES = {
 
 _SKIP_ROLES = {"none", "presentation", "InlineTextBox", "LineBreak", "StaticText"}
 
+# DOM attributes carried into element records.
+_KEEP_ATTRS = frozenset({"id", "name", "type", "placeholder", "aria-label", "data-testid", "href", "value"})
+
 
 def _ax_value(prop: dict | None) -> Any:
     if not prop:
@@ -56,8 +59,7 @@ def _safe_attrs(attr_pairs: list[str]) -> dict[str, str]:
     out: dict[str, str] = {}
     for i in range(0, len(attr_pairs) - 1, 2):
         out[attr_pairs[i]] = attr_pairs[i + 1]
-    keep = {"id", "name", "type", "placeholder", "aria-label", "data-testid", "href", "value"}
-    return {k: v for k, v in out.items() if k in keep}
+    return {k: v for k, v in out.items() if k in _KEEP_ATTRS}
 
 
 def _selector_for(attrs: dict[str, str], tag: str) -> str | None:
@@ -87,8 +89,13 @@ def _build_dom_index(client: CDPClient) -> dict[int, dict]:
             return ""
         return strings[i]
 
+    # The string table is deduplicated, so attribute-name filtering and tag
+    # lowercasing can be resolved once per distinct string rather than once
+    # per node/attribute.
+    keep_idx = {i for i, name in enumerate(strings) if name in _KEEP_ATTRS}
+    tag_cache: dict[int, str] = {}
+
     index: dict[int, dict] = {}
-    keep = {"id", "name", "type", "placeholder", "aria-label", "data-testid", "href", "value"}
 
     for doc in snap.get("documents", []) or []:
         nodes = doc.get("nodes", {}) or {}
@@ -108,13 +115,15 @@ def _build_dom_index(client: CDPClient) -> dict[int, dict]:
         for idx_, bid in enumerate(backend_ids):
             if not bid:
                 continue
-            tag = s(node_names[idx_] if idx_ < len(node_names) else None).lower()
+            name_i = node_names[idx_] if idx_ < len(node_names) else -1
+            tag = tag_cache.get(name_i)
+            if tag is None:
+                tag = tag_cache[name_i] = s(name_i).lower()
             attrs: dict[str, str] = {}
             pairs = attrs_arr[idx_] if idx_ < len(attrs_arr) else []
             for j in range(0, len(pairs) - 1, 2):
-                k = s(pairs[j])
-                if k in keep:
-                    attrs[k] = s(pairs[j + 1])
+                if pairs[j] in keep_idx:
+                    attrs[strings[pairs[j]]] = s(pairs[j + 1])
             index[bid] = {
                 "tag": tag,
                 "attrs": attrs,
@@ -125,10 +134,7 @@ def _build_dom_index(client: CDPClient) -> dict[int, dict]:
 
 def capture_snapshot(client: CDPClient, scope: str | None = None) -> dict:
     """Build a snapshot dict. The store assigns the final ``id``."""
-    client.enable("DOM")
-    client.enable("Runtime")
-    client.enable("DOMSnapshot")
-    client.enable("Accessibility")
+    client.enable("DOM", "Runtime", "DOMSnapshot", "Accessibility")
 
     page = client.page_info()
 
@@ -16,41 +16,53 @@ from pathlib import Path
 
 from ..errors import SnapshotNotFound
 
+try:  # optional: orjson serializes multi-thousand-element snapshots much faster
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
 DEFAULT_DIR = Path(".snapshots")
 
 
 class SnapshotStore:
     def __init__(self, root: Path | str = DEFAULT_DIR):
-        self.root = Path(root)
-        self.root.mkdir(parents=True, exist_ok=True)
+        self.root = Path(root)  # created on first save; readers don't need it
         self._index_path = self.root / "index.json"
 
     def _read_index(self) -> dict:
-        if not self._index_path.exists():
+        try:
+            return json.loads(self._index_path.read_text())
+        except FileNotFoundError:
             return {"next_id": 1, "latest": None}
-        return json.loads(self._index_path.read_text())
 
     def _write_index(self, idx: dict) -> None:
         self._index_path.write_text(json.dumps(idx, indent=2))
 
     def save(self, snapshot: dict) -> str:
         idx = self._read_index()
+        if idx["next_id"] == 1:
+            self.root.mkdir(parents=True, exist_ok=True)
         sid = f"s{idx['next_id']}"
         idx["next_id"] += 1
         idx["latest"] = sid
         snapshot["id"] = sid
-        (self.root / f"{sid}.json").write_text(json.dumps(snapshot, indent=2))
+        # Snapshots are machine-read and can hold thousands of elements, so
+        # skip the indentation (and its whitespace) entirely.
+        (self.root / f"{sid}.json").write_bytes(_dumps(snapshot))
         self._write_index(idx)
         return sid
 
     def load(self, sid: str) -> dict:
-        path = self.root / f"{sid}.json"
-        if not path.exists():
+        try:
+            return _loads((self.root / f"{sid}.json").read_bytes())
+        except FileNotFoundError:
             raise SnapshotNotFound(
                 f"No snapshot named {sid!r}.",
                 hint="Run `inspect` to create a fresh snapshot, then use the returned id.",
-            )
-        return json.loads(path.read_text())
+            ) from None
 
     def latest(self) -> str | None:
         return self._read_index().get("latest")
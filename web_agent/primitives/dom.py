@@ -7,12 +7,14 @@ hatches: navigate to a URL, send a raw key, take a screenshot, evaluate JS.
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Literal
 
 from ..transport import CDPClient
 
 
-def navigate(client: CDPClient, url: str, wait_seconds: float = 2.0) -> dict:
-    client.navigate(url, wait_seconds=wait_seconds)
+def navigate(client: CDPClient, url: str, wait_seconds: float = 2.0,
+             wait_until: Literal["load", "domcontentloaded"] = "load") -> dict:
+    client.navigate(url, wait_seconds=wait_seconds, wait_until=wait_until)
     info = client.page_info()
     return {"ok": True, "action": "navigate", **info}
 
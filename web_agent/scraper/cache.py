@@ -0,0 +1,62 @@
+"""Opt-in on-disk cache for ``fetch`` results.
+
+Layout::
+
+    .fetch-cache/
+        <sha1 of request>.json      # {"cached_at": ..., "result": {...}}
+
+Entries are keyed on everything that shapes the result (URL, engine, user
+agent, html/links flags) and expire by age. Nothing is cached unless the
+caller passes a positive TTL, so live pages are never hidden by default.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+DEFAULT_DIR = Path(".fetch-cache")
+
+
+class FetchCache:
+    def __init__(self, root: Path | str = DEFAULT_DIR, ttl: float = 0.0):
+        self.root = Path(root)
+        self.ttl = ttl
+
+    @staticmethod
+    def key(**request) -> str:
+        return hashlib.sha1(json.dumps(request, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        try:
+            entry = json.loads((self.root / f"{key}.json").read_text())
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry.get("cached_at", 0) > self.ttl:
+            return None
+        return entry.get("result")
+
+    def put(self, key: str, result: dict) -> None:
+        """Best-effort: a cache that can't be written never fails the fetch."""
+        payload = json.dumps({"cached_at": time.time(), "result": result},
+                             separators=(",", ":"))
+        tmp: str | None = None
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            # A unique temp file per writer: concurrent puts of one key (the
+            # same URL twice in a multi-URL fetch) must not share one.
+            with tempfile.NamedTemporaryFile("w", dir=self.root, suffix=".tmp",
+                                             delete=False) as f:
+                tmp = f.name
+                f.write(payload)
+            os.replace(tmp, self.root / f"{key}.json")  # readers never see a partial file
+        except OSError:
+            if tmp is not None:
+                try:
+                    os.unlink(tmp)
+                except OSError:
+                    pass
@@ -2,19 +2,27 @@
 
 Constraints:
 - Same-origin by default; ``--external`` to follow off-site links
-- Respect robots.txt (best-effort; failure to fetch robots = allow)
+- Respect robots.txt (best-effort; a network failure = allow, a 5xx = disallow)
 - Hard caps on ``max_pages`` and ``max_depth``
 - Cooperative cancellation: checks for the cancel sentinel each iteration
+- Optional ``concurrency``: the next queued pages are fetched ahead on a
+  thread pool while the loop processes them strictly in BFS order
 """
 
 from __future__ import annotations
 
 import time
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from urllib import robotparser
 from urllib.parse import urlparse
+from xml.etree import ElementTree as ET
 
-from .fetch import fetch, FetchFailed
+import httpx
+
+from ..transport import CDPClient
+from .fetch import DEFAULT_USER_AGENT, fetch, FetchFailed
+from .http_client import shared_client
 from .jobs import JobStore
 
 
@@ -28,49 +36,59 @@ def _strip_www(host: str) -> str:
     return h
 
 
-def _same_origin(a: str, b: str) -> bool:
-    """Host-equal-modulo-www so http↔https and www↔apex don't break crawls."""
-    pa, pb = urlparse(a), urlparse(b)
-    return _strip_www(pa.netloc) == _strip_www(pb.netloc)
+def _origin_key(url: str) -> str:
+    """Host-modulo-www, so http↔https and www↔apex don't break crawls.
+
+    Compare keys rather than URLs: the seed's key is computed once per crawl
+    instead of re-parsing the seed for every discovered link.
+    """
+    return _strip_www(urlparse(url).netloc)
 
 
-def _robots_for(seed: str) -> robotparser.RobotFileParser | None:
+def _fetch_robots(seed: str, timeout: float) -> httpx.Response | None:
+    """GET ``/robots.txt`` once; both robots rules and sitemap discovery use it."""
+    u = urlparse(seed)
     try:
-        u = urlparse(seed)
-        rp = robotparser.RobotFileParser()
-        rp.set_url(f"{u.scheme}://{u.netloc}/robots.txt")
-        rp.read()
-        return rp
-    except Exception:
+        return shared_client().get(f"{u.scheme}://{u.netloc}/robots.txt",
+                                   timeout=timeout, follow_redirects=True)
+    except httpx.HTTPError:
         return None
 
 
+def _robots_for(resp: httpx.Response | None) -> robotparser.RobotFileParser | None:
+    """Build a parser from a robots.txt response, with urllib's status rules."""
+    if resp is None:
+        return None
+    rp = robotparser.RobotFileParser()
+    if resp.status_code in (401, 403) or resp.status_code >= 500:
+        rp.disallow_all = True  # RFC 9309: unreachable robots.txt = disallow
+    elif 400 <= resp.status_code < 500:
+        rp.allow_all = True
+    else:
+        rp.parse(resp.text.splitlines())
+    return rp
+
+
 def _sitemap_urls(seed: str, timeout: float = 5.0, max_urls: int = 1000,
-                  max_sitemaps: int = 25) -> list[str]:
+                  max_sitemaps: int = 25,
+                  robots: httpx.Response | None = None) -> list[str]:
     """Best-effort sitemap discovery.
 
-    Tries ``robots.txt`` for ``Sitemap:`` directives, then ``/sitemap.xml``
-    fallback. Recursively follows ``<sitemapindex>`` entries up to a hard cap
-    on number of fetched sitemaps. Returns at most ``max_urls`` URLs. Silent
-    on failure — a missing sitemap is normal.
+    Tries ``robots.txt`` (the already-fetched ``robots`` response) for
+    ``Sitemap:`` directives, then ``/sitemap.xml`` fallback. Recursively
+    follows ``<sitemapindex>`` entries up to a hard cap on number of fetched
+    sitemaps. Returns at most ``max_urls`` URLs. Silent on failure — a
+    missing sitemap is normal.
     """
-    import re as _re
-    import httpx
-    from xml.etree import ElementTree as ET
-
     u = urlparse(seed)
     base = f"{u.scheme}://{u.netloc}"
     candidates: list[str] = []
 
     # 1. Sitemap: directives in robots.txt
-    try:
-        r = httpx.get(f"{base}/robots.txt", timeout=timeout, follow_redirects=True)
-        if r.status_code == 200:
-            for line in r.text.splitlines():
-                if line.lower().startswith("sitemap:"):
-                    candidates.append(line.split(":", 1)[1].strip())
-    except httpx.HTTPError:
-        pass
+    if robots is not None and robots.status_code == 200:
+        for line in robots.text.splitlines():
+            if line.lower().startswith("sitemap:"):
+                candidates.append(line.split(":", 1)[1].strip())
 
     # 2. /sitemap.xml fallback
     if not candidates:
@@ -87,26 +105,26 @@ def _sitemap_urls(seed: str, timeout: float = 5.0, max_urls: int = 1000,
             continue
         seen_sitemaps.add(sm_url)
         try:
-            r = httpx.get(sm_url, timeout=timeout, follow_redirects=True)
+            r = shared_client().get(sm_url, timeout=timeout, follow_redirects=True)
             if r.status_code != 200:
                 continue
-            text = r.text
+            body = r.content
             fetched += 1
         except httpx.HTTPError:
             continue
-        # Strip XML namespaces for easier parsing.
-        text = _re.sub(r'\sxmlns="[^"]+"', "", text, count=1)
+        # Parse the raw bytes (the XML declaration names the encoding) and
+        # match any namespace with {*} rather than rewriting the document.
         try:
-            root = ET.fromstring(text)
+            root = ET.fromstring(body)
         except ET.ParseError:
             continue
         # If a sitemap index, queue child sitemaps and continue.
         if root.tag.endswith("sitemapindex"):
-            for sm in root.findall(".//sitemap/loc"):
+            for sm in root.iterfind(".//{*}sitemap/{*}loc"):
                 if sm.text:
                     candidates.append(sm.text.strip())
             continue
-        for loc in root.findall(".//url/loc"):
+        for loc in root.iterfind(".//{*}url/{*}loc"):
             if loc.text:
                 found.append(loc.text.strip())
                 if len(found) >= max_urls:
@@ -115,8 +133,6 @@ def _sitemap_urls(seed: str, timeout: float = 5.0, max_urls: int = 1000,
 
 
 def run_crawl(jid: str, store: JobStore) -> None:
-    from .fetch import DEFAULT_USER_AGENT
-
     spec = store.read_spec(jid)
     seed: str = spec["url"]
     max_pages: int = spec.get("limit", 25)
@@ -128,8 +144,14 @@ def run_crawl(jid: str, store: JobStore) -> None:
     timeout: float = float(spec.get("timeout", 20.0))
     user_agent = spec.get("user_agent") or DEFAULT_USER_AGENT
     use_sitemap: bool = bool(spec.get("use_sitemap", True))
+    concurrency: int = max(1, int(spec.get("concurrency", 1)))
+
+    respect_robots: bool = bool(spec.get("respect_robots", True))
 
-    rp = _robots_for(seed) if spec.get("respect_robots", True) else None
+    # One robots.txt request serves both the allow rules and sitemap discovery.
+    robots = (_fetch_robots(seed, timeout=min(timeout, 10.0))
+              if respect_robots or use_sitemap else None)
+    rp = _robots_for(robots) if respect_robots else None
 
     queue: deque[tuple[str, int]] = deque([(seed, 0)])
     seen: set[str] = {seed}
@@ -144,13 +166,15 @@ def run_crawl(jid: str, store: JobStore) -> None:
             "produce 0 pages. Pass --no-robots to override."
         )
 
+    origin = _origin_key(seed)
+
     # Sitemap seeding — pre-populate the queue with URLs the site has advertised.
     sitemap_count = 0
     if use_sitemap:
-        for sm_url in _sitemap_urls(seed, timeout=min(timeout, 10.0)):
+        for sm_url in _sitemap_urls(seed, timeout=min(timeout, 10.0), robots=robots):
             if sm_url in seen:
                 continue
-            if not external and not _same_origin(seed, sm_url):
+            if not external and _origin_key(sm_url) != origin:
                 continue
             seen.add(sm_url)
             queue.append((sm_url, 1))  # treat as depth-1 from seed
@@ -166,34 +190,78 @@ def run_crawl(jid: str, store: JobStore) -> None:
         sitemap_seeded=sitemap_count,
     )
 
-    seed_canonical = seed
+    # One CDP connection for the whole crawl, opened on first use by the
+    # cdp engine — saves a /json lookup + websocket handshake per page.
+    client = CDPClient(port=port)
+
+    def fetch_page(u: str) -> dict:
+        return fetch(u, engine=engine, port=port,  # type: ignore[arg-type]
+                     timeout=timeout, user_agent=user_agent, client=client)
+
+    # With concurrency > 1, up to that many of the next queued URLs are in
+    # flight while the loop below consumes results in queue order. Each
+    # prefetched request is given a start slot at least --delay after the
+    # previous one and sleeps until it, so the request rate is the same as
+    # the serial path; what overlaps is the waiting on slow responses.
+    pool = ThreadPoolExecutor(max_workers=concurrency) if concurrency > 1 else None
+    pending: dict[str, Future] = {}
+    next_slot = 0.0  # monotonic time the next prefetched request may start
+
+    def fetch_at(u: str, start_at: float) -> dict:
+        wait = start_at - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        return fetch_page(u)
+
+    def prefetch() -> None:
+        nonlocal next_slot
+        budget = min(concurrency, max_pages - pages_done) - len(pending)
+        for u, _ in queue:
+            if budget <= 0:
+                break
+            if u in pending or (rp is not None and not rp.can_fetch(user_agent, u)):
+                continue
+            start_at = max(time.monotonic(), next_slot)
+            next_slot = start_at + delay
+            pending[u] = pool.submit(fetch_at, u, start_at)
+            budget -= 1
+
+    last_fetch: float | None = None  # monotonic time the previous fetch started
     try:
         while queue and pages_done < max_pages:
-            store.tick(jid)  # liveness signal independent of state changes
+            # Pace by time since the previous fetch started rather than
+            # sleeping after every step: the fetch itself counts toward the
+            # delay, skipped URLs cost nothing, and the last page isn't
+            # followed by a pointless sleep. Prefetched requests pace
+            # themselves (see prefetch), so only the serial path sleeps here.
+            if pool is None and delay > 0 and last_fetch is not None:
+                wait = last_fetch + delay - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
             if store.is_cancelled(jid):
                 store.update_status(jid, state="cancelled", finished_at=time.time())
                 return
 
+            if pool is not None:
+                prefetch()
             url, depth = queue.popleft()
-            store.update_status(jid, current_url=url, queue_size=len(queue))
+            # Liveness signal (independent of state changes) plus progress.
+            store.tick(jid, current_url=url, queue_size=len(queue))
 
             if rp is not None and not rp.can_fetch(user_agent, url):
                 errors.append({"url": url, "reason": "robots_disallow"})
                 pages_failed += 1
                 store.update_status(jid, pages_failed=pages_failed, errors=errors[-50:])
-                if delay > 0:
-                    time.sleep(delay)
                 continue
 
+            last_fetch = time.monotonic()
             try:
-                result = fetch(url, engine=engine, port=port,  # type: ignore[arg-type]
-                               timeout=timeout, user_agent=user_agent)
+                future = pending.pop(url, None)
+                result = future.result() if future else fetch_page(url)
             except FetchFailed as e:
                 errors.append({"url": url, "reason": e.message})
                 pages_failed += 1
                 store.update_status(jid, pages_failed=pages_failed, errors=errors[-50:])
-                if delay > 0:
-                    time.sleep(delay)
                 continue
 
             # After the seed fetch, canonicalise to the post-redirect URL so
@@ -201,7 +269,7 @@ def run_crawl(jid: str, store: JobStore) -> None:
             if pages_done == 0:
                 final_url = result.get("url") or url
                 if final_url and final_url != seed:
-                    seed_canonical = final_url
+                    origin = _origin_key(final_url)
 
             store.save_page(jid, url, result)
             pages_done += 1
@@ -210,7 +278,7 @@ def run_crawl(jid: str, store: JobStore) -> None:
                 for link in result.get("links", []):
                     if link in seen:
                         continue
-                    if not external and not _same_origin(seed_canonical, link):
+                    if not external and _origin_key(link) != origin:
                         continue
                     seen.add(link)
                     queue.append((link, depth + 1))
@@ -220,8 +288,6 @@ def run_crawl(jid: str, store: JobStore) -> None:
                 pages_done=pages_done,
                 queue_size=len(queue),
             )
-            if delay > 0:
-                time.sleep(delay)
     except Exception as e:  # noqa: BLE001 — last-line defense, recorded into status
         store.update_status(
             jid,
@@ -230,6 +296,10 @@ def run_crawl(jid: str, store: JobStore) -> None:
             errors=errors + [{"url": None, "reason": f"{type(e).__name__}: {e}"}],
         )
         return
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        client.close()
 
     store.update_status(
         jid,
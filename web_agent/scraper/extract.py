@@ -8,24 +8,23 @@ won't resolve relative hrefs in the output.
 
 from __future__ import annotations
 
-import json
 from typing import Any
-from urllib.parse import urljoin
+from urllib.parse import urldefrag, urljoin
 
 import trafilatura
 from lxml import html as lxhtml
 from selectolax.parser import HTMLParser
 
 
-def _absolutize(html: str, base_url: str | None) -> str:
-    if not base_url or not html:
-        return html
+def _parse_absolute(html: str, base_url: str | None):
+    """Parse once and absolutise links in place. ``None`` if lxml refuses."""
     try:
         tree = lxhtml.fromstring(html)
-        tree.make_links_absolute(base_url, resolve_base_href=True)
-        return lxhtml.tostring(tree, encoding="unicode")
     except (ValueError, lxhtml.etree.ParserError):  # type: ignore[attr-defined]
-        return html
+        return None
+    if base_url:
+        tree.make_links_absolute(base_url, resolve_base_href=True)
+    return tree
 
 
 def extract_markdown(html: str, url: str | None = None) -> dict[str, Any]:
@@ -34,10 +33,14 @@ def extract_markdown(html: str, url: str | None = None) -> dict[str, Any]:
         return {"markdown": "", "title": None, "author": None, "date": None,
                 "description": None}
 
-    html_abs = _absolutize(html, url)
+    # Hand trafilatura the parsed tree rather than re-serialising it: it
+    # copies trees it is given, so the metadata pass below sees the same
+    # untouched document without another parse.
+    tree = _parse_absolute(html, url)
+    doc = tree if tree is not None else html
 
     md = trafilatura.extract(
-        html_abs,
+        doc,
         url=url,
         output_format="markdown",
         include_links=True,
@@ -45,32 +48,21 @@ def extract_markdown(html: str, url: str | None = None) -> dict[str, Any]:
         include_tables=True,
     ) or ""
 
-    meta_json = trafilatura.extract(
-        html_abs,
-        url=url,
-        output_format="json",
-        with_metadata=True,
-    )
-    meta: dict = {}
-    if meta_json:
-        try:
-            meta = json.loads(meta_json)
-        except (ValueError, TypeError):
-            meta = {}
+    # Metadata only — a second full extract() just for its JSON envelope
+    # would redo the whole content pipeline.
+    meta = trafilatura.extract_metadata(doc, default_url=url)
 
     return {
         "markdown": md,
-        "title": meta.get("title"),
-        "author": meta.get("author"),
-        "date": meta.get("date"),
-        "description": meta.get("description"),
+        "title": meta.title,
+        "author": meta.author,
+        "date": meta.date,
+        "description": meta.description,
     }
 
 
 def extract_links(html: str, base_url: str) -> list[str]:
     """Pull all ``<a href>`` links, resolved against the base URL."""
-    from urllib.parse import urldefrag
-
     if not html:
         return []
     tree = HTMLParser(html)
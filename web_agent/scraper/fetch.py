@@ -5,6 +5,8 @@ Engine ladder when ``engine="auto"``:
 2. httpx GET + trafilatura (fast, no JS)
 3. CDP browser + trafilatura (full JS rendering; needs a running CDP browser)
 
+Steps 1 and 2 run concurrently; Jina still wins when both are useful.
+
 The agent receives one JSON object indicating which engine handled it. If a
 fetch returns suspiciously little content (e.g. a JS-only landing page), the
 router escalates to the next engine. Every result has the same shape:
@@ -15,14 +17,22 @@ router escalates to the next engine. Every result has the same shape:
 
 from __future__ import annotations
 
+import posixpath
+import threading
 import time
-from typing import Literal
+from concurrent.futures import Future
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Callable, Literal
 from urllib.parse import urlparse
 
 import httpx
+import websocket
 
-from ..errors import InvalidArguments, WebAgentError
+from ..errors import InvalidArguments, TransportError, WebAgentError
+from ..transport import CDPClient
 from .extract import extract_links, extract_markdown
+from .http_client import shared_client
 from .jina import fetch_via_jina
 
 Engine = Literal["auto", "jina", "http", "cdp"]
@@ -69,6 +79,25 @@ _NON_TEXT_EXT = {
 }
 
 
+def _check_extension(url: str) -> None:
+    """Reject URLs whose path names an obvious binary, with no network I/O."""
+    ext = posixpath.splitext(urlparse(url).path.lower())[1]
+    if ext in _NON_TEXT_EXT:
+        raise UnsupportedContentType(
+            f"URL path ends with {ext!r}, which is not text/HTML.",
+            hint="The URL points at a non-text resource.",
+        )
+
+
+def _check_content_type(headers) -> None:
+    ctype = (headers.get("content-type") or "").split(";")[0].strip().lower()
+    if ctype and not any(ctype.startswith(t) for t in _TEXT_TYPES):
+        raise UnsupportedContentType(
+            f"Content-Type {ctype!r} is not text/HTML.",
+            hint="The URL points at a non-text resource (PDF, image, etc.).",
+        )
+
+
 def _content_type_precheck(url: str, timeout: float) -> None:
     """HEAD-probe the URL for content-type. Cheap PDF/binary guard.
 
@@ -76,28 +105,19 @@ def _content_type_precheck(url: str, timeout: float) -> None:
     returns if HEAD fails or is rejected — the engine path will catch it
     via its own GET. Also short-circuits via URL extension to avoid the
     network round-trip for obvious binary URLs.
+
+    Only the jina and cdp engines need this; the http and auto engines read
+    the content-type off their own GET's response headers.
     """
-    parsed = urlparse(url)
-    path = parsed.path.lower()
-    for ext in _NON_TEXT_EXT:
-        if path.endswith(ext):
-            raise UnsupportedContentType(
-                f"URL path ends with {ext!r}, which is not text/HTML.",
-                hint="The URL points at a non-text resource.",
-            )
+    _check_extension(url)
     try:
-        resp = httpx.head(
+        resp = shared_client().head(
             url, timeout=min(timeout, 5.0), follow_redirects=True,
             headers={"User-Agent": DEFAULT_USER_AGENT},
         )
     except httpx.HTTPError:
         return
-    ctype = (resp.headers.get("content-type") or "").split(";")[0].strip().lower()
-    if ctype and not any(ctype.startswith(t) for t in _TEXT_TYPES):
-        raise UnsupportedContentType(
-            f"Content-Type {ctype!r} is not text/HTML.",
-            hint="The URL points at a non-text resource (PDF, image, etc.).",
-        )
+    _check_content_type(resp.headers)
 
 
 def _empty_result(url: str, engine: str, status: int = 0,
@@ -130,17 +150,33 @@ def _normalize(result: dict) -> dict:
 def _fetch_http(url: str, *, timeout: float = HTTP_TIMEOUT,
                 user_agent: str = DEFAULT_USER_AGENT,
                 retries: int = 2,
-                include_html: bool = False) -> dict:
+                include_html: bool = False,
+                include_links: bool = True,
+                on_headers: Callable[[], None] | None = None,
+                abandoned: threading.Event | None = None) -> dict:
+    """GET ``url`` and extract it.
+
+    ``on_headers`` is called once the response headers have passed the
+    content-type check, before the body is read. Setting ``abandoned``
+    makes the call give up between body chunks and skip further retries.
+    """
     last_exc: Exception | None = None
     resp = None
     for attempt in range(retries + 1):
+        if abandoned is not None and abandoned.is_set():
+            raise FetchFailed(f"Fetch of {url} abandoned.", hint="Another engine answered first.")
         try:
-            with httpx.stream(
+            with shared_client().stream(
                 "GET", url,
                 timeout=timeout,
                 follow_redirects=True,
                 headers={"User-Agent": user_agent},
             ) as r:
+                # Reject binaries from the headers, before reading the body.
+                if r.status_code < 400:
+                    _check_content_type(r.headers)
+                if on_headers is not None:
+                    on_headers()
                 # Pre-flight Content-Length cap.
                 cl = r.headers.get("content-length")
                 if cl and cl.isdigit() and int(cl) > MAX_BODY_BYTES:
@@ -151,6 +187,9 @@ def _fetch_http(url: str, *, timeout: float = HTTP_TIMEOUT,
                 # Stream up to the cap.
                 buf = bytearray()
                 for chunk in r.iter_bytes():
+                    if abandoned is not None and abandoned.is_set():
+                        raise FetchFailed(f"Fetch of {url} abandoned.",
+                                          hint="Another engine answered first.")
                     buf.extend(chunk)
                     if len(buf) > MAX_BODY_BYTES:
                         raise FetchFailed(
@@ -196,58 +235,113 @@ def _fetch_http(url: str, *, timeout: float = HTTP_TIMEOUT,
                   else "Site rejected the request. Try --engine cdp."),
         )
 
-    ctype = (resp.headers.get("content-type") or "").split(";")[0].strip().lower()
-    if ctype and not any(ctype.startswith(t) for t in _TEXT_TYPES):
-        raise UnsupportedContentType(
-            f"Content-Type {ctype!r} is not text/HTML.",
-            hint="The URL points at a non-text resource (PDF, image, etc.).",
-        )
-
     extracted = extract_markdown(resp.text, url=str(resp.url))
     extracted["engine"] = "http"
     extracted["url"] = str(resp.url)
     extracted["status"] = resp.status_code
-    extracted["links"] = extract_links(resp.text, str(resp.url))
+    if include_links:
+        extracted["links"] = extract_links(resp.text, str(resp.url))
     if include_html:
         extracted["html"] = resp.text
     return _normalize(extracted)
 
 
+# Resources the extractor never looks at. Blocking them keeps the CDP engine
+# from downloading megabytes of images/fonts/video per page.
+_HEAVY_EXTENSIONS = (
+    "png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico",
+    "woff", "woff2", "ttf", "otf", "mp4", "webm", "mp3",
+)
+_HEAVY_RESOURCE_PATTERNS = tuple(
+    p for ext in _HEAVY_EXTENSIONS for p in (f"*.{ext}", f"*.{ext}?*")
+)
+
+# Every CDP fetch drives the same tab, so concurrent callers (multi-URL
+# fetch) take turns rather than navigating over each other.
+_CDP_TAB_LOCK = threading.Lock()
+
+# The HTML is capped in the page so an oversized DOM is never serialized
+# over the websocket in full (mirrors MAX_BODY_BYTES on the http engine).
+# Links come from the live DOM in the same round-trip, already resolved by
+# the browser (honouring <base>), with the same skips as extract_links —
+# so they survive truncation and Python never re-parses the HTML for them.
+_PAGE_DUMP_JS = (
+    "(() => { const h = document.documentElement.outerHTML; "
+    "const links = new Set(); "
+    "for (const a of document.querySelectorAll('a[href]')) { "
+    "const raw = a.getAttribute('href'); "
+    "if (!raw || /^(javascript:|mailto:|tel:|#)/.test(raw)) continue; "
+    "try { const u = new URL(raw, document.baseURI); u.hash = ''; links.add(u.href); } catch (e) {} } "
+    "return {url: location.href, title: document.title, links: [...links], "
+    f"html: h.slice(0, {MAX_BODY_BYTES}), truncated: h.length > {MAX_BODY_BYTES}}}; }})()"
+)
+
+
 def _fetch_cdp(url: str, port: int, wait_seconds: float = 2.5, *,
                include_html: bool = False,
-               screenshot_path: str | None = None) -> dict:
-    from pathlib import Path as _Path
-    from ..transport import CDPClient
-
-    with CDPClient(port=port).connect() as client:
-        client.navigate(url, wait_seconds=wait_seconds)
-        info = client.page_info()
-        final_url_check = info.get("url") or ""
-        if final_url_check.startswith("chrome-error://"):
-            raise FetchFailed(
-                f"Browser failed to load {url} (chrome-error page).",
-                hint="DNS, certificate, or network failure. Verify the URL.",
-            )
-        html = client.evaluate("document.documentElement.outerHTML") or ""
-        shot_meta: dict | None = None
-        if screenshot_path:
-            data = client.screenshot_bytes(quality=85)
-            sp = _Path(screenshot_path)
-            sp.parent.mkdir(parents=True, exist_ok=True)
-            sp.write_bytes(data)
-            shot_meta = {"path": str(sp), "bytes": len(data)}
+               include_links: bool = True,
+               screenshot_path: str | None = None,
+               client: CDPClient | None = None) -> dict:
+    """Render ``url`` in the browser and extract it.
+
+    Pass a ``client`` to reuse one CDP connection across many pages (the
+    crawler does); it is connected on first use and left open. Without
+    one, a connection is opened and closed around this call.
+    """
+    if client is None:
+        session = CDPClient(port=port).connect()
+    else:
+        with _CDP_TAB_LOCK:  # a concurrent crawl shares one client across threads
+            if client.ws is None:
+                client.connect()
+        session = nullcontext(client)
+
+    try:
+        with _CDP_TAB_LOCK, session as client:
+            # Screenshots need the page as a user sees it; text extraction doesn't.
+            client.block_urls(() if screenshot_path else _HEAVY_RESOURCE_PATTERNS)
+            client.navigate(url, wait_seconds=wait_seconds)
+            # One round-trip for everything we read off the page.
+            info = client.evaluate(_PAGE_DUMP_JS) or {}
+            final_url_check = info.get("url") or ""
+            if final_url_check.startswith("chrome-error://"):
+                raise FetchFailed(
+                    f"Browser failed to load {url} (chrome-error page).",
+                    hint="DNS, certificate, or network failure. Verify the URL.",
+                )
+            html = info.get("html") or ""
+            shot_meta: dict | None = None
+            if screenshot_path:
+                data = client.screenshot_bytes(quality=85)
+                sp = Path(screenshot_path)
+                sp.parent.mkdir(parents=True, exist_ok=True)
+                sp.write_bytes(data)
+                shot_meta = {"path": str(sp), "bytes": len(data)}
+    except (websocket.WebSocketException, ConnectionError) as e:
+        # Drop a dead shared connection so the next page reconnects.
+        client.close()
+        raise TransportError(
+            f"CDP connection lost while loading {url}: {e}",
+            hint="Check the browser is still running (`python tools/browser.py list`).",
+        ) from e
     final_url = info.get("url") or url
     extracted = extract_markdown(html, url=final_url)
     extracted["engine"] = "cdp"
     extracted["url"] = final_url
     extracted["status"] = 200
-    extracted["links"] = extract_links(html, final_url)
+    if include_links:
+        extracted["links"] = info.get("links") or []
     if not extracted.get("title"):
         extracted["title"] = info.get("title")
     if include_html:
         extracted["html"] = html
     if shot_meta:
         extracted["screenshot"] = shot_meta
+    if info.get("truncated"):
+        extracted["warning"] = (
+            f"Rendered HTML exceeded {MAX_BODY_BYTES:,} characters; "
+            "extracted from the truncated document."
+        )
     return _normalize(extracted)
 
 
@@ -259,14 +353,36 @@ def _useful(result: dict | None) -> bool:
 
 
 JINA_AUTO_TIMEOUT = 8.0  # cap Jina in `auto` mode so a hung Jina doesn't burn the budget
+HEADERS_VERDICT_TIMEOUT = 5.0  # how long a useful Jina result waits on the GET's headers
+
+
+def _in_daemon(fn: Callable, *args, **kwargs) -> Future:
+    """Run ``fn`` on a daemon thread, so an abandoned call can't delay exit."""
+    future: Future = Future()
+
+    def run() -> None:
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:  # noqa: BLE001 — handed to the caller
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
 
 
 def fetch(url: str, engine: Engine = "auto", port: int = 9222, *,
           timeout: float = HTTP_TIMEOUT,
           user_agent: str = DEFAULT_USER_AGENT,
           include_html: bool = False,
-          screenshot_path: str | None = None) -> dict:
-    """Fetch a URL → clean markdown via the chosen engine."""
+          include_links: bool = True,
+          screenshot_path: str | None = None,
+          client: CDPClient | None = None) -> dict:
+    """Fetch a URL → clean markdown via the chosen engine.
+
+    ``client`` is an optional shared CDP connection for the cdp engine; see
+    ``_fetch_cdp``. ``include_links=False`` skips link extraction and
+    returns an empty ``links`` list.
+    """
     _validate_url(url)
     if timeout <= 0:
         raise InvalidArguments(
@@ -280,7 +396,12 @@ def fetch(url: str, engine: Engine = "auto", port: int = 9222, *,
         )
     # Content-type guard runs for every engine to keep PDFs/binaries from
     # leaking through the Jina or CDP paths (which don't sniff Content-Type).
-    _content_type_precheck(url, timeout=timeout)
+    # Engines that issue the plain GET (http, auto) check its headers instead
+    # of paying for a separate HEAD round-trip.
+    if engine in ("http", "auto"):
+        _check_extension(url)
+    else:
+        _content_type_precheck(url, timeout=timeout)
 
     if engine == "jina":
         result = fetch_via_jina(url, timeout=timeout)
@@ -290,11 +411,13 @@ def fetch(url: str, engine: Engine = "auto", port: int = 9222, *,
                 hint="Try --engine http or --engine cdp.",
             )
         result["attempts"] = ["jina:ok"]
+        if not include_links:
+            result["links"] = []
         return _normalize(result)
 
     if engine == "http":
         result = _fetch_http(url, timeout=timeout, user_agent=user_agent,
-                             include_html=include_html)
+                             include_html=include_html, include_links=include_links)
         result["attempts"] = ["http:ok"]
         if not result.get("markdown", "").strip():
             result["warning"] = (
@@ -305,7 +428,8 @@ def fetch(url: str, engine: Engine = "auto", port: int = 9222, *,
 
     if engine == "cdp":
         result = _fetch_cdp(url, port, include_html=include_html,
-                            screenshot_path=screenshot_path)
+                            include_links=include_links,
+                            screenshot_path=screenshot_path, client=client)
         result["attempts"] = ["cdp:ok"]
         if not result.get("markdown", "").strip():
             result["warning"] = (
@@ -313,33 +437,64 @@ def fetch(url: str, engine: Engine = "auto", port: int = 9222, *,
             )
         return result
 
-    # auto: jina → http → cdp, escalating on emptiness.
+    # auto: jina → http → cdp, escalating on emptiness. Jina and http are
+    # independent round-trips, so race them on daemon threads (an abandoned
+    # GET never holds up process exit). The GET doubles as the binary guard:
+    # a useful Jina result only waits for its headers to pass the
+    # content-type check, not for the body or retries, then abandons it.
     attempts: list[str] = []
 
-    j = fetch_via_jina(url, timeout=min(timeout, JINA_AUTO_TIMEOUT))
-    attempts.append("jina:ok" if _useful(j) else ("jina:thin" if j else "jina:fail"))
+    headers_settled = threading.Event()  # GET headers checked, or GET finished
+    abandoned = threading.Event()
+    jina_future = _in_daemon(fetch_via_jina, url, timeout=min(timeout, JINA_AUTO_TIMEOUT))
+    http_future = _in_daemon(_fetch_http, url, timeout=timeout,
+                             user_agent=user_agent, include_html=include_html,
+                             include_links=include_links,
+                             on_headers=headers_settled.set, abandoned=abandoned)
+    http_future.add_done_callback(lambda _: headers_settled.set())
+
+    j = jina_future.result()
     if _useful(j):
+        headers_settled.wait(min(timeout, HEADERS_VERDICT_TIMEOUT))
+        abandoned.set()
+        if http_future.done() and isinstance(http_future.exception(), UnsupportedContentType):
+            raise http_future.exception()  # binary resource; Jina's text doesn't apply
+        attempts.append("jina:ok")
         j["attempts"] = attempts  # type: ignore[index]
+        if not include_links:
+            j["links"] = []  # type: ignore[index]
         return _normalize(j)  # type: ignore[arg-type]
 
-    last: dict | None = None
+    h: dict | None = None
+    http_error: WebAgentError | None = None
     try:
-        h = _fetch_http(url, timeout=timeout, user_agent=user_agent,
-                        include_html=include_html)
+        h = http_future.result()
+    except WebAgentError as e:
+        http_error = e
+
+    if isinstance(http_error, UnsupportedContentType):
+        # Binary resource (PDF etc.): neither Jina's output nor CDP applies.
+        raise http_error
+
+    attempts.append("jina:thin" if j else "jina:fail")
+
+    last: dict | None = None
+    if isinstance(http_error, FetchFailed):
+        attempts.append(f"http:fail({http_error.kind})")
+    elif http_error is not None:
+        raise http_error
+    else:
+        assert h is not None
         attempts.append("http:ok" if _useful(h) else "http:thin")
         if _useful(h):
             h["attempts"] = attempts
             return h
         last = h
-    except UnsupportedContentType:
-        # CDP can't help with PDFs either; surface the original error.
-        raise
-    except FetchFailed as e:
-        attempts.append(f"http:fail({e.kind})")
 
     try:
         c = _fetch_cdp(url, port, include_html=include_html,
-                       screenshot_path=screenshot_path)
+                       include_links=include_links,
+                       screenshot_path=screenshot_path, client=client)
         attempts.append("cdp:ok" if _useful(c) else "cdp:thin")
         c["attempts"] = attempts
         return c
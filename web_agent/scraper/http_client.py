@@ -0,0 +1,32 @@
+"""Process-wide pooled ``httpx.Client`` shared by the scraper engines.
+
+Module-level ``httpx.get``/``httpx.stream`` build a throwaway client per
+call, so every request pays a fresh TCP + TLS handshake. A crawl hits the
+same host (and Jina) over and over; one pooled client keeps those
+connections alive between requests.
+
+Cookies are never stored, so requests stay as independent as they were
+with the one-shot helpers.
+"""
+
+from __future__ import annotations
+
+import threading
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+
+import httpx
+
+_client: httpx.Client | None = None
+_lock = threading.Lock()
+
+
+def shared_client() -> httpx.Client:
+    """Return the shared client, creating it on first use (thread-safe)."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = httpx.Client(
+                    cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+                )
+    return _client
@@ -15,6 +15,8 @@ import re
 
 import httpx
 
+from .http_client import shared_client
+
 JINA_BASE = "https://r.jina.ai/"
 TIMEOUT = 20.0
 
@@ -98,7 +100,7 @@ def _extract_links_from_markdown(md: str) -> list[str]:
 
 def fetch_via_jina(url: str, timeout: float = TIMEOUT) -> dict | None:
     try:
-        resp = httpx.get(
+        resp = shared_client().get(
             JINA_BASE + url,
             timeout=timeout,
             follow_redirects=True,
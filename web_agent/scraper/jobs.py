@@ -10,6 +10,7 @@ Layout::
             cancel                  # presence = cancel signal (cleared after finish)
             pages/
                 <slug>.json         # {url, markdown, title, links, ...}
+            pages.jsonl             # one summary line per saved page
 
 State machine: ``queued → running → done | cancelled | failed | orphaned``.
 
@@ -20,6 +21,7 @@ so two concurrent callers cannot land on the same id.
 from __future__ import annotations
 
 import fcntl
+import hashlib
 import json
 import os
 import re
@@ -47,6 +49,16 @@ def _slugify(s: str, n: int = 80) -> str:
     return (s or "page")[:n]
 
 
+def _page_summary(page: dict, path: Path) -> dict:
+    return {
+        "url": page.get("url"),
+        "title": page.get("title"),
+        "json_path": str(path),
+        "engine": page.get("engine"),
+        "char_count": len(page.get("markdown") or ""),
+    }
+
+
 def _job_sort_key(name: str) -> tuple[int, str]:
     m = re.match(r"j(\d+)$", name)
     return (int(m.group(1)) if m else 10**9, name)
@@ -54,16 +66,14 @@ def _job_sort_key(name: str) -> tuple[int, str]:
 
 class JobStore:
     def __init__(self, root: Path | str = DEFAULT_DIR):
-        self.root = Path(root)
-        self.root.mkdir(parents=True, exist_ok=True)
+        self.root = Path(root)  # created by create(); readers don't need it
         self._index_path = self.root / "index.json"
+        self._content_hashes: dict[str, dict[str, dict]] = {}
 
     def _read_index(self) -> dict:
-        if not self._index_path.exists():
-            return {"next": 1}
         try:
             return json.loads(self._index_path.read_text())
-        except (ValueError, OSError):
+        except (ValueError, OSError):  # includes a missing index
             return {"next": 1}
 
     def _write_index(self, idx: dict) -> None:
@@ -82,6 +92,7 @@ class JobStore:
 
     def create(self, spec: dict) -> str:
         """Allocate a fresh job id atomically. flock-protected."""
+        self.root.mkdir(parents=True, exist_ok=True)
         with self._lock():
             idx = self._read_index()
             # Reconcile counter against any directories created out-of-band.
@@ -120,11 +131,20 @@ class JobStore:
             )
         return d
 
+    def _read_json(self, jid: str, name: str) -> dict:
+        # Read first and only stat the job dir on failure: the common case
+        # (the job exists) costs one open instead of a stat plus an open.
+        try:
+            return json.loads((self.root / jid / name).read_text())
+        except FileNotFoundError:
+            self.job_dir(jid)  # raises JobNotFound if the whole job is gone
+            raise
+
     def read_spec(self, jid: str) -> dict:
-        return json.loads((self.job_dir(jid) / "spec.json").read_text())
+        return self._read_json(jid, "spec.json")
 
     def read_status(self, jid: str) -> dict:
-        return json.loads((self.job_dir(jid) / "status.json").read_text())
+        return self._read_json(jid, "status.json")
 
     def write_status(self, jid: str, status: dict) -> None:
         path = self.root / jid / "status.json"
@@ -141,9 +161,14 @@ class JobStore:
         self.write_status(jid, status)
         return status
 
-    def tick(self, jid: str) -> None:
-        """Worker liveness signal — call from the top of each loop iteration."""
+    def tick(self, jid: str, **changes) -> None:
+        """Worker liveness signal — call from the top of each loop iteration.
+
+        Any ``changes`` are patched in with the same read/write, so the loop
+        can report progress without a second status round-trip.
+        """
         status = self.read_status(jid)
+        status.update(changes)
         status["heartbeat"] = time.time()
         self.write_status(jid, status)
 
@@ -157,12 +182,10 @@ class JobStore:
         (self.job_dir(jid) / "cancel").touch()
 
     def is_cancelled(self, jid: str) -> bool:
-        return (self.job_dir(jid) / "cancel").exists()
+        return (self.root / jid / "cancel").exists()
 
     def clear_cancel(self, jid: str) -> None:
-        sentinel = self.job_dir(jid) / "cancel"
-        if sentinel.exists():
-            sentinel.unlink()
+        (self.job_dir(jid) / "cancel").unlink(missing_ok=True)
 
     def reconcile(self, jid: str) -> dict:
         """Mark a 'running' job as orphaned if the worker is dead or its
@@ -199,31 +222,88 @@ class JobStore:
             )
         return status
 
+    def _content_index(self, jid: str) -> dict[str, dict]:
+        """content_hash → manifest entry of the first page saved with that body."""
+        index = self._content_hashes.get(jid)
+        if index is None:
+            index = {}
+            for entry in self._read_manifest(jid):
+                digest = entry.get("content_hash")
+                if digest and "duplicate_of" not in entry:
+                    index.setdefault(digest, entry)
+            self._content_hashes[jid] = index
+        return index
+
+    def _read_manifest(self, jid: str) -> list[dict]:
+        try:
+            text = (self.job_dir(jid) / "pages.jsonl").read_text()
+        except FileNotFoundError:
+            return []
+        out: list[dict] = []
+        for line in text.splitlines():
+            try:
+                out.append(json.loads(line))
+            except ValueError:
+                continue  # torn final line from a killed worker
+        return out
+
+    def _append_manifest(self, jid: str, entry: dict) -> None:
+        with open(self.root / jid / "pages.jsonl", "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
     def save_page(self, jid: str, url: str, page: dict) -> Path:
-        slug = _slugify(url)
-        base = slug
+        """Store a fetched page. Returns the path of its JSON file.
+
+        A page whose markdown matches one already saved for this job (the
+        same article behind tracking params, aliases, trailing slashes) is
+        not written again: its manifest entry points at the stored copy and
+        names it in ``duplicate_of``.
+        """
+        markdown = page.get("markdown") or ""
+        digest = hashlib.sha1(markdown.encode()).hexdigest() if markdown else None
+        seen = self._content_index(jid)
+        if digest and digest in seen:
+            original = seen[digest]
+            path = Path(original["json_path"])
+            self._append_manifest(jid, {**_page_summary(page, path), "content_hash": digest,
+                                        "duplicate_of": original["url"]})
+            return path
+
+        pages_dir = self.job_dir(jid) / "pages"
+        base = slug = _slugify(url)
         i = 2
-        while (self.job_dir(jid) / "pages" / f"{slug}.json").exists():
-            slug = f"{base}-{i}"
-            i += 1
-        page_path = self.job_dir(jid) / "pages" / f"{slug}.json"
-        page_path.write_text(json.dumps({"saved_at": time.time(), **page}, indent=2))
+        # Exclusive create claims a free name in one call per attempt,
+        # instead of stat-ing each candidate before writing.
+        while True:
+            page_path = pages_dir / f"{slug}.json"
+            try:
+                f = open(page_path, "x")
+            except FileExistsError:
+                slug = f"{base}-{i}"
+                i += 1
+                continue
+            with f:
+                f.write(json.dumps({"saved_at": time.time(), **page}, indent=2))
+            break
+        # Summary for list_pages, so results don't re-read every page body.
+        entry = _page_summary(page, page_path)
+        if digest:
+            entry["content_hash"] = digest
+            seen[digest] = entry
+        self._append_manifest(jid, entry)
         return page_path
 
     def list_pages(self, jid: str) -> list[dict]:
-        out: list[dict] = []
+        out = self._read_manifest(jid)
+        if out:
+            return sorted(out, key=lambda p: p["json_path"])
+        # Jobs written before the manifest existed: summarise page files.
         for p in sorted((self.job_dir(jid) / "pages").glob("*.json")):
             try:
                 doc = json.loads(p.read_text())
             except (ValueError, OSError):
                 continue
-            out.append({
-                "url": doc.get("url"),
-                "title": doc.get("title"),
-                "json_path": str(p),
-                "engine": doc.get("engine"),
-                "char_count": len(doc.get("markdown") or ""),
-            })
+            out.append(_page_summary(doc, p))
         return out
 
     def list_jobs(self) -> list[str]:
@@ -8,17 +8,62 @@ Replaces the legacy ``tools/web_tool.py``. Differences:
 
 from __future__ import annotations
 
+import base64
 import json
 import re
 import sys
 import time
-from typing import Any
+from typing import Any, Literal
 
 import requests
 import websocket
 
 from ..errors import JSExecutionError, TransportError
 
+try:  # optional: orjson parses large CDP payloads (DOM snapshots, page HTML) faster
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# Page lifecycle event each navigate ``wait_until`` value blocks on.
+_WAIT_UNTIL_EVENTS = {
+    "load": "Page.loadEventFired",
+    "domcontentloaded": "Page.domContentEventFired",
+}
+
+# Page-side scripts are fixed, so they live at module scope instead of being
+# reassembled on every call. Only the clipboard payload varies; it is
+# %-formatted in (the script's own braces rule out str.format).
+_CLIPBOARD_WRITE_JS = (
+    "(async () => {"
+    "  const html = %s;"
+    "  const text = %s;"
+    "  const item = new ClipboardItem({"
+    "    'text/html': new Blob([html], {type: 'text/html'}),"
+    "    'text/plain': new Blob([text], {type: 'text/plain'}),"
+    "  });"
+    "  await navigator.clipboard.write([item]);"
+    "  return true;"
+    "})()"
+)
+
+_FOCUSED_EDITABLE_JS = (
+    "(() => {"
+    "  const el = document.activeElement;"
+    "  if (!el) return {editable: false, descriptor: 'none'};"
+    "  const tag = el.tagName.toLowerCase();"
+    "  let editable = !!el.isContentEditable || tag === 'textarea' || tag === 'iframe';"
+    "  if (tag === 'input') {"
+    "    const t = (el.getAttribute('type') || 'text').toLowerCase();"
+    "    editable = ['text','search','url','tel','email','password','number',''].includes(t);"
+    "  }"
+    "  const id = el.id ? ('#' + el.id) : '';"
+    "  return {editable, descriptor: tag + id + (tag === 'iframe' ? ' (focus delegated)' : '')};"
+    "})()"
+)
+
+_PAGE_INFO_JS = "({url: location.href, title: document.title, viewport: [innerWidth, innerHeight]})"
+
 
 class CDPClient:
     def __init__(self, port: int = 9222, tab_index: int = 0):
@@ -58,13 +103,15 @@ class CDPClient:
         # others are domain-specific and enabled lazily by their consumers.
         self.cmd("Page.enable")
         self._enabled: set[str] = {"Page"}
+        self._blocked_urls: tuple[str, ...] = ()
         return self
 
-    def enable(self, domain: str) -> None:
-        if domain in self._enabled:
+    def enable(self, *domains: str) -> None:
+        missing = [d for d in dict.fromkeys(domains) if d not in self._enabled]
+        if not missing:
             return
-        self.cmd(f"{domain}.enable")
-        self._enabled.add(domain)
+        self.cmd_many([(f"{d}.enable", None) for d in missing])
+        self._enabled.update(missing)
 
     def close(self) -> None:
         if self.ws:
@@ -74,7 +121,9 @@ class CDPClient:
                 self.ws = None
 
     def __enter__(self) -> "CDPClient":
-        return self.connect()
+        # ``with CDPClient(...).connect() as c`` is the usual idiom; don't
+        # open (and leak) a second websocket when already connected.
+        return self if self.ws else self.connect()
 
     def __exit__(self, *exc) -> None:
         self.close()
@@ -87,7 +136,7 @@ class CDPClient:
         self.msg_id += 1
         self.ws.send(json.dumps({"id": self.msg_id, "method": method, "params": params or {}}))
         while True:
-            response = json.loads(self.ws.recv())
+            response = _loads(self.ws.recv())
             if response.get("id") == self.msg_id:
                 if "error" in response:
                     err = response["error"]
@@ -97,6 +146,39 @@ class CDPClient:
                     )
                 return response.get("result", {})
 
+    def cmd_many(self, calls: list[tuple[str, dict | None]]) -> list[dict]:
+        """Send several commands back-to-back, then collect every reply.
+
+        Chrome runs a session's commands in order, so this behaves like
+        sequential ``cmd`` calls but costs one round-trip instead of N.
+        Replies are returned in call order; if any command failed, all
+        replies are drained first (keeping the socket in sync) and the
+        first failure is raised.
+        """
+        if not self.ws:
+            raise TransportError("CDPClient not connected.", hint="Call .connect() first.")
+        first_id = self.msg_id + 1
+        for method, params in calls:
+            self.msg_id += 1
+            self.ws.send(json.dumps({"id": self.msg_id, "method": method, "params": params or {}}))
+        pending: dict[int, dict] = {}
+        while len(pending) < len(calls):
+            response = _loads(self.ws.recv())
+            rid = response.get("id")
+            if isinstance(rid, int) and first_id <= rid <= self.msg_id:
+                pending[rid] = response
+        results: list[dict] = []
+        for offset, (method, _) in enumerate(calls):
+            response = pending[first_id + offset]
+            if "error" in response:
+                err = response["error"]
+                raise TransportError(
+                    f"{method}: {err.get('message', err)}",
+                    hint="Verify the page is loaded and the target node still exists.",
+                )
+            results.append(response.get("result", {}))
+        return results
+
     # -- JavaScript evaluation ----------------------------------------------
 
     def evaluate(self, code: str, return_by_value: bool = True) -> Any:
@@ -125,11 +207,15 @@ class CDPClient:
 
     # -- helpers used by primitives -----------------------------------------
 
-    def navigate(self, url: str, wait_seconds: float = 2.0) -> None:
-        """Navigate and wait for Page.loadEventFired, capped at wait_seconds.
+    def navigate(self, url: str, wait_seconds: float = 2.0,
+                 wait_until: Literal["load", "domcontentloaded"] = "load") -> None:
+        """Navigate and wait for the page's load event, capped at wait_seconds.
 
+        ``wait_until="domcontentloaded"`` returns once the document is parsed
+        instead of waiting for images, ads and trackers to finish loading.
         Falls back to a sleep if the websocket lib doesn't expose timeouts.
         """
+        event = _WAIT_UNTIL_EVENTS[wait_until]
         self.cmd("Page.navigate", {"url": url})
         if not self.ws or wait_seconds <= 0:
             return
@@ -142,23 +228,46 @@ class CDPClient:
                     return
                 self.ws.settimeout(remaining)
                 try:
-                    msg = json.loads(self.ws.recv())
+                    msg = _loads(self.ws.recv())
                 except Exception:
                     return  # timeout or socket hiccup — caller still proceeds
-                if msg.get("method") == "Page.loadEventFired":
+                if msg.get("method") == event:
                     return
         finally:
             self.ws.settimeout(prev_timeout)
 
     def screenshot_bytes(self, quality: int = 80, fmt: str = "jpeg") -> bytes:
-        import base64
-
-        params: dict = {"format": fmt}
+        # optimizeForSpeed trades a little compression for a much faster
+        # encode inside Chrome; older builds ignore it.
+        params: dict = {"format": fmt, "optimizeForSpeed": True}
         if fmt == "jpeg":
             params["quality"] = quality
         result = self.cmd("Page.captureScreenshot", params)
         return base64.b64decode(result["data"])
 
+    def block_urls(self, patterns: list[str] | tuple[str, ...]) -> None:
+        """Block requests matching the wildcard ``patterns`` for this session.
+
+        An empty list lifts the block. Overrides are per-connection, so they
+        go away when the client disconnects, and re-applying the blocklist
+        already in force is free. Blocking needs the Network domain, whose
+        events nobody reads, so lifting the block disables it again.
+        Best-effort: a browser that rejects the call just loads everything.
+        """
+        patterns = tuple(patterns)
+        if patterns == self._blocked_urls:
+            return
+        try:
+            if patterns:
+                self.enable("Network")
+                self.cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+            else:
+                self.cmd_many([("Network.setBlockedURLs", {"urls": []}), ("Network.disable", None)])
+                self._enabled.discard("Network")
+        except TransportError:
+            return
+        self._blocked_urls = patterns
+
     def get_box_for_backend_id(self, backend_node_id: int) -> dict | None:
         try:
             self.enable("DOM")
@@ -168,15 +277,17 @@ class CDPClient:
         return box.get("model")
 
     def dispatch_click(self, x: float, y: float) -> None:
-        for ev in ("mousePressed", "mouseReleased"):
-            self.cmd(
-                "Input.dispatchMouseEvent",
-                {"type": ev, "x": x, "y": y, "button": "left", "clickCount": 1},
-            )
+        self.cmd_many([
+            ("Input.dispatchMouseEvent",
+             {"type": ev, "x": x, "y": y, "button": "left", "clickCount": 1})
+            for ev in ("mousePressed", "mouseReleased")
+        ])
 
     def dispatch_key(self, key: str) -> None:
-        self.cmd("Input.dispatchKeyEvent", {"type": "keyDown", "key": key})
-        self.cmd("Input.dispatchKeyEvent", {"type": "keyUp", "key": key})
+        self.cmd_many([
+            ("Input.dispatchKeyEvent", {"type": "keyDown", "key": key}),
+            ("Input.dispatchKeyEvent", {"type": "keyUp", "key": key}),
+        ])
 
     def type_text(self, text: str) -> None:
         # Input.insertText sends the whole string in one round-trip rather
@@ -236,19 +347,7 @@ class CDPClient:
             # Cheap tag-strip so the plain-text flavor isn't empty.
             text = re.sub(r"<[^>]+>", "", html)
             text = re.sub(r"\s+\n", "\n", text).strip()
-        expr = (
-            "(async () => {"
-            f"  const html = {json.dumps(html)};"
-            f"  const text = {json.dumps(text)};"
-            "  const item = new ClipboardItem({"
-            "    'text/html': new Blob([html], {type: 'text/html'}),"
-            "    'text/plain': new Blob([text], {type: 'text/plain'}),"
-            "  });"
-            "  await navigator.clipboard.write([item]);"
-            "  return true;"
-            "})()"
-        )
-        self.evaluate(expr)
+        self.evaluate(_CLIPBOARD_WRITE_JS % (json.dumps(html), json.dumps(text)))
 
     def focused_editable(self) -> dict:
         """Report whether the currently focused element can receive a paste.
@@ -261,21 +360,7 @@ class CDPClient:
         ``<iframe>`` itself — we treat iframes as editable (focus delegated)
         rather than block the paste.
         """
-        js = (
-            "(() => {"
-            "  const el = document.activeElement;"
-            "  if (!el) return {editable: false, descriptor: 'none'};"
-            "  const tag = el.tagName.toLowerCase();"
-            "  let editable = !!el.isContentEditable || tag === 'textarea' || tag === 'iframe';"
-            "  if (tag === 'input') {"
-            "    const t = (el.getAttribute('type') || 'text').toLowerCase();"
-            "    editable = ['text','search','url','tel','email','password','number',''].includes(t);"
-            "  }"
-            "  const id = el.id ? ('#' + el.id) : '';"
-            "  return {editable, descriptor: tag + id + (tag === 'iframe' ? ' (focus delegated)' : '')};"
-            "})()"
-        )
-        result = self.evaluate(js)
+        result = self.evaluate(_FOCUSED_EDITABLE_JS)
         if not isinstance(result, dict):
             return {"editable": False, "descriptor": "unknown"}
         return result
@@ -299,8 +384,5 @@ class CDPClient:
         self.cmd("Input.dispatchKeyEvent", {"type": "keyUp", **base})
 
     def page_info(self) -> dict:
-        info = self.evaluate(
-            "({url: location.href, title: document.title, "
-            "viewport: [innerWidth, innerHeight]})"
-        )
+        info = self.evaluate(_PAGE_INFO_JS)
         return info or {"url": None, "title": None, "viewport": None}